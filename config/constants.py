@@ -23,11 +23,11 @@ class ConfigLimits:
     THRESHOLD_DEFAULT = -60
     
     # Valid angle units (English only - UI translation handled by translations.py)
-    VALID_ANGLE_UNITS = ["degrees", "radians"]
+    VALID_ANGLE_UNITS = frozenset({"degrees", "radians"})
     DEFAULT_ANGLE_UNIT = "degrees"
     
     # Valid scale options (English only - UI translation handled by translations.py)
-    VALID_SCALES = ["dB", "linear"]
+    VALID_SCALES = frozenset({"dB", "linear"})
     DEFAULT_SCALE = "linear"
     
     # Array factor normalization option
@@ -3,25 +3,100 @@ Configuration management for the antenna synthesis application.
 Handles loading and saving of global parameters to maintain user preferences.
 """
 
-import json
 import sys
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Mapping
 from pathlib import Path
+from types import MappingProxyType
+import orjson
 from .constants import ConfigLimits
 
+# Resource base path, resolved once: PyInstaller bundle dir, or the working dir in dev mode
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
 def resource_path(relative_path):
     """ Gets the absolute path to the resource, works for development and PyInstaller """
-    if hasattr(sys, '_MEIPASS'):
-        base_path = sys._MEIPASS
-    else:
-        # Dev mode
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+@lru_cache(maxsize=None)
+def _get_bundled_config_path(config_file: str) -> Path:
+    """
+    Gets the path to config.json that is bundled inside the .exe.
+    Uses our resource_path function.
+    """
+    # The relative path from project root is "config/config.json"
+    return Path(resource_path(os.path.join("config", config_file)))
+
+# Limits bound once at module level, so building defaults and the schema avoids class lookups
+_PRECISION_MIN, _PRECISION_MAX, _PRECISION_DEFAULT = (
+    ConfigLimits.PRECISION_MIN, ConfigLimits.PRECISION_MAX, ConfigLimits.PRECISION_DEFAULT)
+_RESOLUTION_MIN, _RESOLUTION_MAX, _RESOLUTION_DEFAULT = (
+    ConfigLimits.RESOLUTION_MIN, ConfigLimits.RESOLUTION_MAX, ConfigLimits.RESOLUTION_DEFAULT)
+_THRESHOLD_MIN, _THRESHOLD_MAX, _THRESHOLD_DEFAULT = (
+    ConfigLimits.THRESHOLD_MIN, ConfigLimits.THRESHOLD_MAX, ConfigLimits.THRESHOLD_DEFAULT)
+_ANGLE_UNITS, _DEFAULT_ANGLE_UNIT = ConfigLimits.VALID_ANGLE_UNITS, ConfigLimits.DEFAULT_ANGLE_UNIT
+_SCALES, _DEFAULT_SCALE = ConfigLimits.VALID_SCALES, ConfigLimits.DEFAULT_SCALE
+
+# Config schema field types. Each returns a predicate a loaded value must satisfy,
+# values failing it are replaced by their default.
+def _int_field(minimum: int, maximum: int):
+    """Integer (not bool) within [minimum, maximum]."""
+    return lambda value: type(value) is int and minimum <= value <= maximum
+
+def _number_field(minimum: float, maximum: float):
+    """Integer or float (not bool) within [minimum, maximum]."""
+    return lambda value: type(value) in (int, float) and minimum <= value <= maximum
 
-    return os.path.join(base_path, relative_path)
+def _choice_field(choices):
+    """One of the given string options."""
+    return lambda value: isinstance(value, str) and value in choices
+
+def _type_field(*types):
+    """Value of exactly one of the given types."""
+    return lambda value: type(value) in types
 
 class ConfigManager:
     """Manages application configuration settings."""
+
+    # Default configuration values using centralized constants. Read-only: use
+    # _fresh_defaults() to get a mutable copy.
+    default_config: Mapping[str, Any] = MappingProxyType({
+        'precision_decimals': _PRECISION_DEFAULT,
+        'font_size': 12,
+        'angle_unit_input': _DEFAULT_ANGLE_UNIT,
+        'angle_unit_rectangular': _DEFAULT_ANGLE_UNIT,
+        'angle_unit_polar': _DEFAULT_ANGLE_UNIT,
+        'element_phase_unit': _DEFAULT_ANGLE_UNIT,
+        'rectangular_scale': _DEFAULT_SCALE,
+        'polar_scale': _DEFAULT_SCALE,
+        'resolution': _RESOLUTION_DEFAULT,
+        'threshold_db': _THRESHOLD_DEFAULT,
+        'normalize_array_factor': ConfigLimits.DEFAULT_NORMALIZE_ARRAY_FACTOR,
+        'last_method': None,
+        'method_inputs': MappingProxyType({})
+    })
+
+    # Keys persisted to the config file, in file order
+    _DEFAULT_KEYS = tuple(default_config)
+
+    # Config schema: key -> predicate for every validated key, mirroring ConfigLimits.
+    # Limits are captured in the predicates' closures, validation does no lookups.
+    # Keys without an entry (e.g. font_size) are taken as loaded.
+    _SCHEMA = {
+        'precision_decimals': _int_field(_PRECISION_MIN, _PRECISION_MAX),
+        'angle_unit_input': _choice_field(_ANGLE_UNITS),
+        'angle_unit_rectangular': _choice_field(_ANGLE_UNITS),
+        'angle_unit_polar': _choice_field(_ANGLE_UNITS),
+        'element_phase_unit': _choice_field(_ANGLE_UNITS),
+        'rectangular_scale': _choice_field(_SCALES),
+        'polar_scale': _choice_field(_SCALES),
+        'resolution': _int_field(_RESOLUTION_MIN, _RESOLUTION_MAX),
+        'threshold_db': _number_field(_THRESHOLD_MIN, _THRESHOLD_MAX),
+        'normalize_array_factor': _type_field(bool),
+        'last_method': _type_field(str, type(None)),
+        'method_inputs': _type_field(dict),
+    }
     
     def __init__(self, app_name: str = "AntennaSynthesisApp", config_file: str = "config.json"):
         """Initialize configuration manager.
@@ -33,44 +108,27 @@ class ConfigManager:
         self.config_file_name = config_file
 
         self.user_config_path = self._get_user_config_path()
-        self.bundled_config_path = self._get_bundled_config_path()        
-        self.default_config = self._get_default_config()
+        self.bundled_config_path = _get_bundled_config_path(config_file)
+
+        # Parsed configuration and the user file mtime it was read at
+        self._cached_config = None
+        self._cached_mtime = None
+
+        # Method state saved in memory but not yet written: last method and inputs per method
+        self._pending_last_method = None
+        self._pending_inputs: Dict[str, Dict[str, Any]] = {}
         
     def _get_user_config_path(self) -> Path:
         """
         Get the full path to the configuration file.
         Example: C:/Users/YourUser/AppData/Roaming/AntennaSynthesisApp/config.json
         """
-        # Use the application directory for simplicity
-        config_dir = Path.home() / self.app_name
-        config_dir.mkdir(exist_ok=True) # Create folder if it doesn't exist
-        return config_dir / self.config_file_name
-    
-    def _get_bundled_config_path(self) -> str:
-        """
-        Gets the path to config.json that is bundled inside the .exe.
-        Uses our resource_path function.
-        """
-        # The relative path from project root is "config/config.json"
-        return resource_path(os.path.join("config", self.config_file_name))
-    
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration values using centralized constants."""
-        return {
-            'precision_decimals': ConfigLimits.PRECISION_DEFAULT,
-            'font_size': 12,
-            'angle_unit_input': ConfigLimits.DEFAULT_ANGLE_UNIT,
-            'angle_unit_rectangular': ConfigLimits.DEFAULT_ANGLE_UNIT,
-            'angle_unit_polar': ConfigLimits.DEFAULT_ANGLE_UNIT,
-            'element_phase_unit': ConfigLimits.DEFAULT_ANGLE_UNIT,
-            'rectangular_scale': ConfigLimits.DEFAULT_SCALE,
-            'polar_scale': ConfigLimits.DEFAULT_SCALE,
-            'resolution': ConfigLimits.RESOLUTION_DEFAULT,
-            'threshold_db': ConfigLimits.THRESHOLD_DEFAULT,
-            'normalize_array_factor': ConfigLimits.DEFAULT_NORMALIZE_ARRAY_FACTOR,
-            'last_method': None,
-            'method_inputs': {}
-        }
+        # Use the application directory for simplicity. The folder is created on first save.
+        return Path.home() / self.app_name / self.config_file_name
+
+    def _fresh_defaults(self) -> Dict[str, Any]:
+        """Get a mutable copy of the defaults. Only 'method_inputs' is nested."""
+        return {**self.default_config, 'method_inputs': {}}
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -79,72 +137,85 @@ class ConfigManager:
         1. Try to load from USER path.
         2. If it fails, try to load from BUNDLED path (inside .exe).
         3. If everything fails, use default values.
+
+        The parsed result is cached and reused until the user file changes on disk.
+        Returns a copy for callers that modify it; read-only callers should use
+        load_config_readonly().
         """
+        return self._ensure_loaded().copy()
+
+    def load_config_readonly(self) -> Mapping[str, Any]:
+        """Load configuration as a read-only view of the cached dict, without copying."""
+        return MappingProxyType(self._ensure_loaded())
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        """Get the cached configuration, (re)loading it if the user file changed.
+
+        Returns the cached dict itself, callers outside this class must copy it.
+        """
+        user_mtime = self._get_user_config_mtime()
+        if self._cached_config is not None and self._cached_mtime == user_mtime:
+            return self._cached_config
+
         config_to_load = None
+        trusted = False
         
         # 1. First, try to load user configuration
-        if self.user_config_path.exists():
-            try:
-                with open(self.user_config_path, 'r', encoding='utf-8') as f:
-                    config_to_load = json.load(f)
-            except (json.JSONDecodeError, PermissionError):
-                # User file is corrupted or inaccessible, move to next option
-                config_to_load = None
+        try:
+            config_to_load = orjson.loads(self.user_config_path.read_bytes())
+        except (orjson.JSONDecodeError, FileNotFoundError, PermissionError):
+            # User file is missing, corrupted or inaccessible, move to next option
+            config_to_load = None
         
         # 2. If there's no user configuration, load the one that comes with the app
         if config_to_load is None:
             try:
-                # Note: self.bundled_config_path is already a string
-                with open(self.bundled_config_path, 'r', encoding='utf-8') as f:
-                    config_to_load = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError, PermissionError):
+                config_to_load = orjson.loads(self.bundled_config_path.read_bytes())
+                # Shipped with the app and authored by us, no need to validate it
+                trusted = True
+            except (orjson.JSONDecodeError, FileNotFoundError, PermissionError):
                 # If even the bundled file fails, we'll use defaults
                 config_to_load = None
         
         # If no file could be loaded, return defaults
         if config_to_load is None:
             print("Warning: Could not load any config file. Using hardcoded defaults.")
-            return self.default_config.copy()
-            
-        # Merge with defaults to ensure no new keys are missing
-        final_config = self.default_config.copy()
-        final_config.update(config_to_load)
+            final_config = self._fresh_defaults()
+        else:
+            final_config = self._validate_config(config_to_load, trusted=trusted)
+
+        # Unsaved method state goes on top of whatever is on disk now
+        self._apply_pending(final_config)
+        self._cached_config = final_config
+        self._cached_mtime = user_mtime
+        return final_config
+
+    def _get_user_config_mtime(self) -> int | None:
+        """Get the user config file modification time in ns, or None if it does not exist."""
+        try:
+            return self.user_config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _validate_config(self, config: Dict[str, Any], trusted: bool = False) -> Dict[str, Any]:
+        """Build a complete configuration from loaded values in a single pass.
         
-        return self._validate_config(final_config)   
-    
-    
-    def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate configuration values are within acceptable ranges using centralized constants."""
-        validated_config = config.copy()
+        Every known key is emitted: loaded values that pass the config schema are
+        kept, missing or invalid ones take their default. Unknown keys are dropped.
         
-        # Validate precision_decimals
-        precision = validated_config.get('precision_decimals', ConfigLimits.PRECISION_DEFAULT)
-        if not (ConfigLimits.PRECISION_MIN <= precision <= ConfigLimits.PRECISION_MAX):
-            validated_config['precision_decimals'] = ConfigLimits.PRECISION_DEFAULT
-            
-        # Validate resolution
-        resolution = validated_config.get('resolution', ConfigLimits.RESOLUTION_DEFAULT)
-        if not (ConfigLimits.RESOLUTION_MIN <= resolution <= ConfigLimits.RESOLUTION_MAX):
-            validated_config['resolution'] = ConfigLimits.RESOLUTION_DEFAULT
-            
-        # Validate threshold_db
-        threshold = validated_config.get('threshold_db', ConfigLimits.THRESHOLD_DEFAULT)
-        if not (ConfigLimits.THRESHOLD_MIN <= threshold <= ConfigLimits.THRESHOLD_MAX):
-            validated_config['threshold_db'] = ConfigLimits.THRESHOLD_DEFAULT
-            
-        # Validate angle units
-        for key in ['angle_unit_input', 'angle_unit_rectangular', 'angle_unit_polar', 'element_phase_unit']:
-            if validated_config.get(key) not in ConfigLimits.VALID_ANGLE_UNITS:
-                validated_config[key] = self.default_config[key]
-                
-        # Validate scale options
-        for key in ['rectangular_scale', 'polar_scale']:
-            if validated_config.get(key) not in ConfigLimits.VALID_SCALES:
-                validated_config[key] = self.default_config[key]
+        Args:
+            config: Loaded configuration values
+            trusted: Skip the schema checks, for the bundled config shipped with the app
+        """
+        schema = self._SCHEMA
+        validated_config = self._fresh_defaults()
         
-        # Validate normalize_array_factor (must be boolean)
-        if not isinstance(validated_config.get('normalize_array_factor'), bool):
-            validated_config['normalize_array_factor'] = ConfigLimits.DEFAULT_NORMALIZE_ARRAY_FACTOR
+        for key in self._DEFAULT_KEYS:
+            if key in config:
+                value = config[key]
+                is_valid = schema.get(key)
+                if trusted or is_valid is None or is_valid(value):
+                    validated_config[key] = value
                 
         return validated_config
     
@@ -152,83 +223,134 @@ class ConfigManager:
         """
         Save configuration ALWAYS to USER path.
         """
+        config_to_save = {key: config[key] for key in self._DEFAULT_KEYS if key in config}
+
+        if not self._write_config_file(config_to_save):
+            return False
+
+        # Keep the cache in sync with what was just written, plus any unsaved method state
+        self._cached_config = self._validate_config(config_to_save)
+        self._apply_pending(self._cached_config)
+        self._cached_mtime = self._get_user_config_mtime()
+        return True
+
+    def _write_config_file(self, config: Dict[str, Any]) -> bool:
+        """Serialize a configuration dict to the USER path.
+
+        The file is written to a temporary sibling and atomically renamed over
+        the real one, so a crash mid-save never leaves a truncated config.
+        """
+        # orjson always emits UTF-8, matching the previous ensure_ascii=False output
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        tmp_path = self.user_config_path.with_suffix('.json.tmp')
         try:
             # Ensure user folder exists
             self.user_config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            config_to_save = {}
-            for key in self.default_config.keys():
-                if key in config:
-                    config_to_save[key] = config[key]
-            
-            with open(self.user_config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.user_config_path)
             
             return True
             
         except (PermissionError, OSError) as e:
             print(f"Error: Could not save config file to {self.user_config_path} ({e}).")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
     
     def reset_to_defaults(self) -> Dict[str, Any]:
         """Reset configuration to default values."""
         try:
-            if self.user_config_path.exists():
-                self.user_config_path.unlink()  # Delete user's config file
+            self.user_config_path.unlink(missing_ok=True)  # Delete user's config file
         except (PermissionError, OSError):
             pass
+
+        # Drop the cache so the next load falls back to the bundled config
+        self._cached_config = None
+        self._cached_mtime = None
+        self._pending_last_method = None
+        self._pending_inputs = {}
             
-        return self.default_config.copy()   
+        return self._fresh_defaults()
     
     def save_method_state(self, method_name: str, inputs: Dict[str, Any]) -> bool:
         """Save the current method and its inputs.
         
+        The change is kept in memory until flush() writes it, so callers can
+        debounce rapid successive saves (e.g. with a single-shot QTimer) into
+        one disk write. Call flush() before exiting to keep pending changes.
+        
         Args:
             method_name: Name of the current method
-            inputs: Dictionary with method-specific input values
+            inputs: Dictionary with method-specific input values, stored without copying
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Load current config
-            config = self.load_config()
-            
-            # Update method state
-            config['last_method'] = method_name
-            if 'method_inputs' not in config:
-                config['method_inputs'] = {}
-            config['method_inputs'][method_name] = inputs.copy()
-            
-            # Save updated config
-            return self.save_config(config)
+            self._pending_last_method = method_name
+            self._pending_inputs[method_name] = inputs
+            # Update the cached config in place, it has already been validated
+            self._apply_pending(self._ensure_loaded())
+            return True
             
         except Exception as e:
             print(f"Error saving method state: {e}")
             return False
+
+    def flush(self) -> bool:
+        """Write pending method state to disk now.
+        
+        The pending state is merged into the current on-disk configuration, so
+        changes written meanwhile by other ConfigManager instances are kept.
+        
+        Returns:
+            bool: True if there was nothing to write or the write succeeded
+        """
+        if self._pending_last_method is None:
+            return True
+        if not self._write_config_file(self._ensure_loaded()):
+            return False
+        self._cached_mtime = self._get_user_config_mtime()
+        self._pending_last_method = None
+        self._pending_inputs = {}
+        return True
+
+    def _apply_pending(self, config: Dict[str, Any]):
+        """Apply the unsaved method state to a configuration dict in place."""
+        if self._pending_last_method is None:
+            return
+        config['last_method'] = self._pending_last_method
+        # The outer dict is rebuilt so the shared default 'method_inputs' dict is never mutated
+        config['method_inputs'] = {**config.get('method_inputs', {}), **self._pending_inputs}
     
-    def load_method_state(self) -> tuple[str | None, Dict[str, Any]]:
+    def load_method_state(self) -> tuple[str | None, Mapping[str, Any]]:
         """Load the last used method and its inputs.
         
         Returns:
-            tuple: (method_name, inputs_dict)
+            tuple: (method_name, read-only view of its inputs)
         """
         try:
-            config = self.load_config()
+            config = self._ensure_loaded()
             last_method = config.get('last_method')
             method_inputs = config.get('method_inputs', {})
             
             if last_method and last_method in method_inputs:
-                return last_method, method_inputs[last_method].copy()
+                return last_method, MappingProxyType(method_inputs[last_method])
             else:
-                return None, {}
+                return None, MappingProxyType({})
                 
         except Exception as e:
             print(f"Error loading method state: {e}")
-            return None, {}
+            return None, MappingProxyType({})
     
     def get_method_inputs(self, method_name: str) -> Dict[str, Any]:
-        """Get saved inputs for a specific method.
+        """Get a copy of the saved inputs for a specific method, for callers that modify it.
         
         Args:
             method_name: Name of the method
@@ -237,10 +359,27 @@ class ConfigManager:
             Dictionary with saved inputs for the method
         """
         try:
-            config = self.load_config()
+            config = self._ensure_loaded()
             method_inputs = config.get('method_inputs', {})
             return method_inputs.get(method_name, {}).copy()
             
         except Exception as e:
             print(f"Error getting method inputs: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def get_method_inputs_readonly(self, method_name: str) -> Mapping[str, Any]:
+        """Get a read-only view of the saved inputs for a specific method, without copying.
+        
+        Args:
+            method_name: Name of the method
+            
+        Returns:
+            Read-only mapping with saved inputs for the method
+        """
+        try:
+            method_inputs = self._ensure_loaded().get('method_inputs', {})
+            return MappingProxyType(method_inputs.get(method_name, {}))
+            
+        except Exception as e:
+            print(f"Error getting method inputs: {e}")
+            return MappingProxyType({})
\ No newline at end of file
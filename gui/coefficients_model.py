@@ -0,0 +1,126 @@
+"""
+Table model for the excitation coefficients of the synthesized array.
+"""
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont
+from functools import lru_cache
+from typing import List
+from translations import translations
+
+# Unicode subscripts for coefficient indices such as a₋₁
+_SUBSCRIPT_DIGITS = str.maketrans("0123456789-", "₀₁₂₃₄₅₆₇₈₉₋")
+
+# Roles resolved once; data() runs for every visible cell and role
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_FONT_ROLE = Qt.ItemDataRole.FontRole
+
+
+@lru_cache(maxsize=1024)
+def _format_subscript(number: int) -> str:
+    """Convert an integer to Unicode subscript characters."""
+    return str(number).translate(_SUBSCRIPT_DIGITS)
+
+
+class CoefficientsTableModel(QAbstractTableModel):
+    """Excitation coefficients backed by NumPy arrays, formatted on demand.
+
+    Columns are index, magnitude, phase (°), phase (rad), real and imaginary part.
+    Without coefficients the model has no rows; the view shows the 'not computed'
+    message itself.
+    """
+
+    COLUMN_COUNT = 6
+    # Index column centered, numeric columns right-aligned
+    COLUMN_ALIGNMENT = (Qt.AlignmentFlag.AlignCenter,) + (Qt.AlignmentFlag.AlignRight,) * (COLUMN_COUNT - 1)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._labels: List[str] = []
+        self._values = np.empty((0, self.COLUMN_COUNT - 1))
+        self._precision = 3
+        self._headers = self.headers()
+
+        # Use a font that supports mathematical notation well
+        self._index_font = QFont()
+        self._index_font.setFamily("Times New Roman")
+        self._index_font.setPointSize(14)
+
+    def set_coefficients(self, excitations, indices: np.ndarray, precision: int):
+        """Replace the coefficients shown by the model."""
+        self.beginResetModel()
+        excitations = np.asarray(excitations, dtype=complex)
+        # magnitude, phase (deg), phase (rad), real part, imaginary part
+        self._values = np.column_stack((np.abs(excitations), np.angle(excitations, deg=True),
+                                        np.angle(excitations), excitations.real, excitations.imag))
+        self._labels = [f"a{_format_subscript(index)}" for index in indices.tolist()]
+        self._precision = precision
+        self.endResetModel()
+
+    def clear(self):
+        """Drop the coefficients, if any."""
+        if not self._labels:
+            return
+        self.beginResetModel()
+        self._labels = []
+        self._values = np.empty((0, self.COLUMN_COUNT - 1))
+        self.endResetModel()
+
+    def is_empty(self) -> bool:
+        """True while no coefficients are set."""
+        return not self._labels
+
+    def retranslate(self):
+        """Refresh the cached headers after a language change."""
+        self._headers = self.headers()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._labels)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == _DISPLAY_ROLE:
+            if column == 0:
+                return self._labels[row]
+            return self._format_value(self._values[row, column - 1])
+        if role == _ALIGNMENT_ROLE:
+            return self.COLUMN_ALIGNMENT[column]
+        if role == _FONT_ROLE and column == 0:
+            return self._index_font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    @staticmethod
+    def headers() -> List[str]:
+        """Translated column headers for the current language."""
+        return [
+            translations.tr("coefficient_index"),
+            translations.tr("coefficient_magnitude"),
+            translations.tr("coefficient_phase") + " (°)",
+            translations.tr("coefficient_phase") + " (rad)",
+            translations.tr("coefficient_real"),
+            translations.tr("coefficient_imaginary")
+        ]
+
+    def _format_value(self, value: float) -> str:
+        """Format a value with the current precision, showing '-' for rounded zeros."""
+        formatted = f"{value:.{self._precision}f}"
+        # Only '-', '0' and '.' remain when the value rounds to zero
+        if not formatted.lstrip("-0."):
+            return "-"
+        return formatted
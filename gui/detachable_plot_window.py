@@ -1,15 +1,23 @@
 """
 Detachable plot window for displaying matplotlib figures in separate windows.
+
+Matplotlib is imported lazily, the first time a plot is actually detached.
 """
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QToolBar, QMenu
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QToolBar, QMenu, QScrollArea
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction, QIcon
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
 from translations import translations
 
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+    from matplotlib.figure import Figure
+
 
 class DetachablePlotWindow(QMainWindow):
     """A detachable window that can display a matplotlib figure."""
@@ -25,6 +33,8 @@ class DetachablePlotWindow(QMainWindow):
         self.figure = figure
         self.canvas = None
         self.toolbar = None
+        self._owns_canvas = False
+        self._owns_toolbar = False
         
         self.setWindowTitle(title)
         self.setGeometry(100, 100, 800, 600)
@@ -65,28 +75,82 @@ class DetachablePlotWindow(QMainWindow):
         self.plot_toolbar.addAction(self.close_action)
     
     def set_figure(self, figure: Figure):
-        """Set the matplotlib figure to display."""
-        # Remove existing canvas and toolbar if any
-        if self.canvas:
-            self.main_layout.removeWidget(self.canvas)
-            self.canvas.deleteLater()
-            self.canvas = None
-        if self.toolbar:
-            self.main_layout.removeWidget(self.toolbar)
-            self.toolbar.deleteLater()
-            self.toolbar = None
+        """Set the matplotlib figure to display.
+        
+        Once this window has its own canvas, later figures are swapped into it
+        in place, keeping the canvas and toolbar widgets.
+        """
+        if self.canvas is not None and self._owns_canvas:
+            # Fit the new figure to the current canvas size and swap it in
+            figure.set_size_inches(self.figure.get_size_inches(), forward=False)
+            self.figure = figure
+            self.canvas.figure = figure
+            figure.set_canvas(self.canvas)
+            
+            # Reset the navigation history, it belonged to the previous figure
+            self.toolbar.update()
+            self.canvas.draw_idle()
+            return
+        
+        # Hand back a shared canvas before creating our own
+        if self.canvas is not None:
+            self.take_canvas()
         
-        # Create new canvas and toolbar
+        from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+        from .plotting_widget import FigureCanvas
+        
+        # Create canvas and toolbar
         self.figure = figure
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
+        self._owns_canvas = True
+        self._owns_toolbar = True
         
         # Add to layout
         self.main_layout.addWidget(self.toolbar)
         self.main_layout.addWidget(self.canvas)
         
         # Refresh the canvas
-        self.canvas.draw()
+        self.canvas.draw_idle()
+    
+    def set_canvas(self, canvas: FigureCanvas, toolbar: NavigationToolbar = None):
+        """Display an existing canvas (and its figure) instead of building a new one.
+        
+        The canvas' existing navigation toolbar is moved along with it when given,
+        otherwise a new one is created for this window.
+        """
+        self.figure = canvas.figure
+        self.canvas = canvas
+        self._owns_canvas = False
+        self._owns_toolbar = toolbar is None
+        if toolbar is None:
+            from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+            toolbar = NavigationToolbar(self.canvas, self)
+        self.toolbar = toolbar
+        
+        self.main_layout.addWidget(self.toolbar)
+        self.main_layout.addWidget(self.canvas)
+        self.toolbar.show()
+        self.canvas.show()
+        self.canvas.draw_idle()
+    
+    def take_canvas(self) -> FigureCanvas:
+        """Remove the displayed canvas (and a toolbar given with it) from this window and return it."""
+        canvas = self.canvas
+        if self.toolbar:
+            self.main_layout.removeWidget(self.toolbar)
+            if self._owns_toolbar:
+                self.toolbar.deleteLater()
+            else:
+                self.toolbar.setParent(None)
+            self.toolbar = None
+        if canvas:
+            self.main_layout.removeWidget(canvas)
+            canvas.setParent(None)
+        self.canvas = None
+        self.figure = None
+        self._owns_canvas = False
+        return canvas
     
     def get_figure(self):
         """Get the current matplotlib figure."""
@@ -128,17 +192,22 @@ class PlotManager:
             self.detached_plots[plot_id].activateWindow()
             return
         
-        # Store original container info
+        from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+        
+        # Store original container info, the canvas and its toolbar are moved, not rebuilt
+        toolbar = original_container.findChild(NavigationToolbar)
+        canvas = self._take_canvas_from_container(original_container)
         self.original_plots[plot_id] = {
             'container': original_container,
-            'figure': figure
+            'figure': figure,
+            'canvas': canvas,
+            'toolbar': toolbar
         }
         
-        # Create detached window with a new figure that shares the same content
+        # Create detached window and move the existing canvas into it, no copy is made
         detached_window = DetachablePlotWindow(plot_id, title, None, self.main_window)
-        
-        # Copy the figure content to the detached window
-        self._copy_figure_content(figure, detached_window)
+        detached_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        detached_window.set_canvas(canvas, toolbar)
         detached_window.reattach_requested.connect(self.reattach_plot)
         detached_window.window_closed.connect(self.on_plot_window_closed)
         
@@ -155,21 +224,17 @@ class PlotManager:
         if plot_id not in self.detached_plots:
             return
         
-        detached_window = self.detached_plots[plot_id]
-        original_info = self.original_plots[plot_id]
+        # Clean up first, so the window_closed signal emitted by close() is ignored
+        detached_window = self.detached_plots.pop(plot_id)
+        original_info = self.original_plots.pop(plot_id)
         
-        # Get the original container
-        original_container = original_info['container']
-        
-        # Show the original container again (it was just hidden, not modified)
-        original_container.show()
+        # Move the canvas and toolbar back and show the original container again
+        detached_window.take_canvas()
+        self._return_canvas_to_container(original_info)
+        original_info['container'].show()
         
         # Close detached window
         detached_window.close()
-        
-        # Clean up
-        del self.detached_plots[plot_id]
-        del self.original_plots[plot_id]
     
     def on_plot_window_closed(self, plot_id: str):
         """Handle when a detached plot window is closed."""
@@ -225,66 +290,35 @@ class PlotManager:
                     widgets.append(item.widget())
         return widgets
     
-    def _recreate_original_structure(self, plot_id: str, container):
-        """Recreate the original structure if widgets were lost."""
-        layout = container.layout()
-        if not layout:
-            return
-        
-        main_window = self.main_window
+    def _take_canvas_from_container(self, container) -> FigureCanvas:
+        """Detach the figure canvas from its place inside the container."""
+        # Base class of the Agg and Cairo Qt canvases
+        from matplotlib.backends.backend_qt import FigureCanvasQT
         
-        # Recreate the original toolbar and canvas structure
-        if plot_id == 'array_factor':
-            from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-            toolbar = NavigationToolbar(main_window.af_canvas, main_window)
-            layout.addWidget(toolbar)
-            layout.addWidget(main_window.af_canvas)
-        elif plot_id == 'polar':
-            from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-            toolbar = NavigationToolbar(main_window.polar_canvas, main_window)
-            layout.addWidget(toolbar)
-            layout.addWidget(main_window.polar_canvas)
-        elif plot_id == 'excitations':
-            from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-            toolbar = NavigationToolbar(main_window.excitations_canvas, main_window)
-            layout.addWidget(toolbar)
-            layout.addWidget(main_window.excitations_canvas)
-        elif plot_id == 'elements':
-            from PySide6.QtWidgets import QScrollArea
-            scroll_area = QScrollArea()
-            scroll_area.setWidget(main_window.elements_canvas)
-            scroll_area.setWidgetResizable(True)
-            layout.addWidget(scroll_area)
+        canvas = container.findChild(FigureCanvasQT)
+        scroll_area = container.findChild(QScrollArea)
+        if scroll_area and scroll_area.widget() is canvas:
+            scroll_area.takeWidget()
+        else:
+            canvas.parentWidget().layout().removeWidget(canvas)
+        return canvas
     
-    def _copy_figure_content(self, source_figure: Figure, detached_window):
-        """Copy the content from source figure to detached window."""
-        import io
-        
-        try:
-            # Save figure to bytes buffer
-            buf = io.BytesIO()
-            source_figure.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-            buf.seek(0)
-            
-            # Create new figure and display the image
-            figsize = source_figure.get_size_inches()
-            new_figure = Figure(figsize=(float(figsize[0]), float(figsize[1])))
-            ax = new_figure.add_subplot(111)
-            
-            # Load and display the image
-            import matplotlib.image as mpimg
-            img = mpimg.imread(buf, format='png')
-            ax.imshow(img)
-            ax.axis('off')  # Hide axes for clean display
-            
-            # Set the figure in the detached window
-            detached_window.set_figure(new_figure)
-            
-        except Exception:
-            # Fallback: create a simple text figure
-            new_figure = Figure(figsize=(8, 6))
-            ax = new_figure.add_subplot(111)
-            ax.text(0.5, 0.5, f"📊 {detached_window.plot_id}\n(Plot snapshot)", 
-                   ha='center', va='center', fontsize=14)
-            ax.axis('off')
-            detached_window.set_figure(new_figure)
\ No newline at end of file
+    def _return_canvas_to_container(self, original_info):
+        """Put a canvas and its toolbar back at their place inside the original container."""
+        container = original_info['container']
+        canvas = original_info['canvas']
+        toolbar = original_info['toolbar']
+        
+        # Restore the toolbar reference in case the detached window created its own
+        canvas.toolbar = toolbar
+        
+        scroll_area = container.findChild(QScrollArea)
+        if scroll_area:
+            scroll_area.setWidget(canvas)
+        else:
+            layout = container.layout()
+            if toolbar:
+                layout.addWidget(toolbar)
+                toolbar.show()
+            layout.addWidget(canvas)
+        canvas.show()
@@ -5,40 +5,214 @@ Main window for the antenna synthesis GUI application.
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QSplitter, QTabWidget, QScrollArea, QGroupBox,
                               QPushButton, QLabel, QSpinBox, QDoubleSpinBox,
-                              QComboBox, QTextEdit, QLineEdit, QFileDialog,
+                              QComboBox, QPlainTextEdit, QLineEdit, QFileDialog,
                               QFormLayout, QFrame, QMessageBox,
                               QCheckBox, QDialog, QDialogButtonBox,
-                              QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView,
+                              QSizePolicy, QTableView, QHeaderView,
                               QMenu)
-from PySide6.QtCore import Qt, QThread, QObject, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QObject, QPoint, QRunnable, QThreadPool, QSignalBlocker, Signal, Slot, QTimer
+from PySide6.QtGui import QAction
 import numpy as np
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
+import ast
 import json
-import csv
+import operator
 import os
 import re
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 
-from methods import SchelkunoffMethod, FourierMethod, DolphChebyshevMethod
-from .plotting_widget import PlottingWidget
+from .plotting_widget import PlottingWidget, ResizeDebouncedCanvas
 from .detachable_plot_window import PlotManager
 from translations import translations
 from .preferences_dialog import PreferencesDialog
+from .coefficients_model import CoefficientsTableModel
 from config import ConfigManager, ConfigLimits
 
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
+def _build_methods():
+    """Instantiate the synthesis methods, importing them on first use."""
+    from methods import SchelkunoffMethod, FourierMethod, DolphChebyshevMethod
+    return {
+        'Schelkunoff': SchelkunoffMethod(),
+        'Fourier': FourierMethod(),
+        'DolphChebyshev': DolphChebyshevMethod()
+    }
 
-# from gui.plots.rectangular_plot import RectangularAFPlotWidget
-# from gui.plots.polar_plot import PolarAFPlotWidget # (You would create this)
-# from gui.plots.excitations_plot import ExcitationsPlotWidget # (You would create this)
+# Operators allowed in angle expressions such as '3*pi/4' or '-pi/2'
+_PI_BINARY_OPS = {ast.Add: operator.add, ast.Sub: operator.sub,
+                  ast.Mult: operator.mul, ast.Div: operator.truediv,
+                  ast.Pow: operator.pow}
+_PI_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+def _eval_pi_node(node):
+    """Evaluate an arithmetic AST node made only of numbers, 'pi', + - * / ** and parentheses."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name) and node.id == 'pi':
+        return np.pi
+    if isinstance(node, ast.BinOp) and type(node.op) in _PI_BINARY_OPS:
+        return _PI_BINARY_OPS[type(node.op)](_eval_pi_node(node.left), _eval_pi_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _PI_UNARY_OPS:
+        return _PI_UNARY_OPS[type(node.op)](_eval_pi_node(node.operand))
+    raise ValueError(f"Unsupported element: {ast.dump(node)}")
+
+# Characters allowed in angle expressions: numbers, operators, parentheses and 'pi'
+_PI_EXPR_RE = re.compile(r'^[0-9+\-*/().\spi]+$')
+
+# Single 'a*pi/b' terms, the usual entries of angle lists; spaces allowed around operators
+_PI_TERM_RE = re.compile(r'^([+-]?)\s*(?:(\d+\.?\d*|\.\d+)\s*\*\s*)?pi(?:\s*/\s*(\d+\.?\d*|\.\d+))?$')
+
+# Precomputed values for the angles users type most
+_COMMON_PI_EXPRS = {
+    "pi": np.pi, "-pi": -np.pi, "2*pi": 2*np.pi,
+    "pi/2": np.pi/2, "-pi/2": -np.pi/2, "3*pi/2": 3*np.pi/2,
+    "pi/3": np.pi/3, "2*pi/3": 2*np.pi/3,
+    "pi/4": np.pi/4, "3*pi/4": 3*np.pi/4,
+    "pi/6": np.pi/6, "0": 0.0,
+}
+
+# Computation errors translated directly from their key
+_SIMPLE_ERROR_KEYS = frozenset({
+    "number_of_elements_minimum", "beam_angles_not_sorted", "beam_angles_max_repetition",
+    "could_not_parse_beam_angles", "invalid_number_of_beams", "error_could_not_parse_null_angles",
+    "error_null_positions_cannot_be_empty", "error_d_lambda_must_be_positive",
+    "error_resolution_must_be_at_least_16", "error_main_beam_angle_out_of_range",
+    "error_number_of_elements_min_2", "error_number_of_elements_min_1",
+    "error_sidelobe_level_must_be_finite", "error_theta0_rad_out_of_range",
+})
+
+# Computation errors sent as "key:detail"; formatted with the translated key and the detail
+_DETAIL_ERROR_FORMATS = {
+    "error_could_not_parse_beam_angles": "{} {}",
+    "error_unknown_beam_shape": "{}: '{}'",
+    "error_unknown_normalization_method": "{}: '{}'",
+}
+
+# Output boxes only show a few lines; longer arrays show their first and last entries
+_OUTPUT_PREVIEW_HEAD = 20
+_OUTPUT_PREVIEW_TAIL = 5
+
+@lru_cache(maxsize=256)
+def _eval_pi_expression(expression: str) -> float:
+    """Parse and evaluate a normalized pi expression. Results are cached per expression."""
+    try:
+        return float(_eval_pi_node(ast.parse(expression, mode='eval').body))
+    except (SyntaxError, ValueError, TypeError, ZeroDivisionError, OverflowError):
+        raise ValueError(f"Invalid expression: {expression}")
+
+@lru_cache(maxsize=512)
+def _wrap_text(text: str, max_length: int) -> str:
+    """Wrap text at word boundaries into lines of at most max_length. Results are cached."""
+    if len(text) <= max_length:
+        return text
+        
+    # Find good break points (spaces, commas, parentheses)
+    words = text.split()
+    lines = []
+    current_line = ""
+    
+    for word in words:
+        if len(current_line + " " + word) <= max_length:
+            if current_line:
+                current_line += " " + word
+            else:
+                current_line = word
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    
+    if current_line:
+        lines.append(current_line)
+        
+    return "\n".join(lines)
+
+@lru_cache(maxsize=16)
+def _fixed_formatter(precision: int) -> Callable[[float], str]:
+    """Bound str.format for fixed-point output with the given number of decimals."""
+    return f"{{:.{precision}f}}".format
+
+# Rows formatted per block when writing the array factor CSV
+_CSV_CHUNK_ROWS = 65536
+
+def _write_array_factor_csv(filename: str, columns: List[np.ndarray], precision: int):
+    """Write theta (deg, rad), AF, normalized AF and AF (dB) columns to a CSV file."""
+    theta_deg, theta_rad, af, normalized_af, af_db = columns
+    
+    # Write CSV file; every cell is a plain number, so rows are joined directly
+    # instead of going through csv.writer (same "\r\n" line endings, no quoting needed)
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        # Write header
+        f.write(",".join(['Theta (degrees)', 'Theta (radians)', 'AF (complex)', 'AF Normalized (complex)', 'AF (dB)']) + "\r\n")
+        
+        # Format whole column blocks at once; complex numbers as "real+imag*j"
+        fixed = f"%.{precision}f"
+        signed = f"%+.{precision}f"
+        
+        def format_complex(values):
+            return np.char.add(np.char.add(np.char.mod(fixed, values.real), np.char.mod(signed, values.imag)), "j")
+        
+        # Write data in blocks of rows, so the formatted strings of long sweeps
+        # never exist all at once
+        for start in range(0, len(theta_deg), _CSV_CHUNK_ROWS):
+            block = slice(start, start + _CSV_CHUNK_ROWS)
+            f.writelines(",".join(row) + "\r\n" for row in zip(
+                np.char.mod(fixed, theta_deg[block]).tolist(),
+                np.char.mod(fixed, theta_rad[block]).tolist(),
+                format_complex(af[block]).tolist(),
+                format_complex(normalized_af[block]).tolist(),
+                np.char.mod(fixed, af_db[block]).tolist()
+            ))
+
+class _ResultsJSONEncoder(json.JSONEncoder):
+    """Encode NumPy results as they are written, without converting them beforehand."""
+    
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            if obj.dtype == complex:
+                # Complex arrays as a list of [real, imag] pairs
+                return np.column_stack((obj.real, obj.imag)).tolist()
+            return obj.tolist()
+        if isinstance(obj, complex):
+            return [float(obj.real), float(obj.imag)]
+        if isinstance(obj, (np.integer, np.floating)):
+            return float(obj)
+        return super().default(obj)
+
+@contextmanager
+def _updates_disabled(*widgets: QWidget):
+    """Suspend painting of the widgets while they are rebuilt; they repaint once afterwards."""
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.setUpdatesEnabled(True)
 
 class GlobalParametersDialog(QDialog):
     """Dialog for editing global parameters."""
     
+    # Internal (English) values stored as item data, in combo item order
+    ANGLE_VALUES = ("degrees", "radians")
+    SCALE_VALUES = ("dB", "linear")
+    
+    # (widget attribute, main window attribute / value key, kind) for every field
+    _FIELDS = (
+        ('precision_spin', 'precision_decimals', 'spin'),
+        ('angle_input_combo', 'angle_unit_input', 'angle'),
+        ('angle_rect_combo', 'angle_unit_rectangular', 'angle'),
+        ('angle_polar_combo', 'angle_unit_polar', 'angle'),
+        ('element_phase_combo', 'element_phase_unit', 'angle'),
+        ('rectangular_scale_combo', 'rectangular_scale', 'scale'),
+        ('polar_scale_combo', 'polar_scale', 'scale'),
+        ('resolution_spin', 'resolution', 'spin'),
+        ('threshold_spin', 'threshold_db', 'spin'),
+        ('normalize_checkbox', 'normalize_array_factor', 'bool'),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle(translations.tr("global_parameters_title"))
@@ -48,6 +222,12 @@ class GlobalParametersDialog(QDialog):
         # Get current values from parent
         self.main_window = parent
         
+        # Translated option labels, looked up once per dialog
+        self._t_deg = translations.tr("degrees")
+        self._t_rad = translations.tr("radians")
+        self._t_db = translations.tr("db")
+        self._t_lin = translations.tr("linear")
+        
         # Apply current font size from parent
         if parent and hasattr(parent, 'current_font_size'):
             font = self.font()
@@ -81,7 +261,7 @@ class GlobalParametersDialog(QDialog):
         
         # Input angle unit
         self.angle_input_combo = QComboBox()
-        self.angle_input_combo.addItems([translations.tr("degrees"), translations.tr("radians")])
+        self._populate_combo(self.angle_input_combo, (self._t_deg, self._t_rad), self.ANGLE_VALUES)
         form_layout.addRow(translations.tr("input_angle_unit"), self.angle_input_combo)
         
         # Separator 2: After input angle unit
@@ -92,17 +272,17 @@ class GlobalParametersDialog(QDialog):
         
         # Rectangular plot angle unit
         self.angle_rect_combo = QComboBox()
-        self.angle_rect_combo.addItems([translations.tr("degrees"), translations.tr("radians")])
+        self._populate_combo(self.angle_rect_combo, (self._t_deg, self._t_rad), self.ANGLE_VALUES)
         form_layout.addRow(translations.tr("rectangular_plot_unit"), self.angle_rect_combo)
         
         # Polar plot angle unit
         self.angle_polar_combo = QComboBox()
-        self.angle_polar_combo.addItems([translations.tr("degrees"), translations.tr("radians")])
+        self._populate_combo(self.angle_polar_combo, (self._t_deg, self._t_rad), self.ANGLE_VALUES)
         form_layout.addRow(translations.tr("polar_plot_unit"), self.angle_polar_combo)
         
         # Element phase unit
         self.element_phase_combo = QComboBox()
-        self.element_phase_combo.addItems([translations.tr("degrees"), translations.tr("radians")])
+        self._populate_combo(self.element_phase_combo, (self._t_deg, self._t_rad), self.ANGLE_VALUES)
         form_layout.addRow(translations.tr("element_phase_unit"), self.element_phase_combo)
         
         # Separator 3: After element phase unit
@@ -113,12 +293,12 @@ class GlobalParametersDialog(QDialog):
         
         # Rectangular plot scale
         self.rectangular_scale_combo = QComboBox()
-        self.rectangular_scale_combo.addItems([translations.tr("db"), translations.tr("linear")])
+        self._populate_combo(self.rectangular_scale_combo, (self._t_db, self._t_lin), self.SCALE_VALUES)
         form_layout.addRow(translations.tr("rectangular_plot_scale"), self.rectangular_scale_combo)
         
         # Polar plot scale
         self.polar_scale_combo = QComboBox()
-        self.polar_scale_combo.addItems([translations.tr("db"), translations.tr("linear")])
+        self._populate_combo(self.polar_scale_combo, (self._t_db, self._t_lin), self.SCALE_VALUES)
         form_layout.addRow(translations.tr("polar_plot_scale"), self.polar_scale_combo)
         
         # Separator 4: After polar plot scale
@@ -156,88 +336,101 @@ class GlobalParametersDialog(QDialog):
         layout.addWidget(button_box)
     
     def load_current_values(self):
-        """Load current values from main window, converting internal values to UI text."""
-        if self.main_window:
-            self.precision_spin.setValue(self.main_window.precision_decimals)
-            self._set_angle_unit_combo(self.angle_input_combo, self.main_window.angle_unit_input)
-            self._set_angle_unit_combo(self.angle_rect_combo, self.main_window.angle_unit_rectangular)
-            self._set_angle_unit_combo(self.angle_polar_combo, self.main_window.angle_unit_polar)
-            self._set_angle_unit_combo(self.element_phase_combo, self.main_window.element_phase_unit)
-            self._set_scale_combo(self.rectangular_scale_combo, self.main_window.rectangular_scale)
-            self._set_scale_combo(self.polar_scale_combo, self.main_window.polar_scale)
-            self.resolution_spin.setValue(self.main_window.resolution)
-            self.threshold_spin.setValue(self.main_window.threshold_db)
-            self.normalize_checkbox.setChecked(self.main_window.normalize_array_factor)
+        """Load current values from main window, selecting the items for internal values."""
+        if not self.main_window:
+            return
+        for widget_name, key, kind in self._FIELDS:
+            widget = getattr(self, widget_name)
+            value = getattr(self.main_window, key)
+            match kind:
+                case 'spin':
+                    widget.setValue(value)
+                case 'angle':
+                    self._set_angle_unit_combo(widget, value)
+                case 'scale':
+                    self._set_scale_combo(widget, value)
+                case 'bool':
+                    widget.setChecked(value)
+    
+    def _populate_combo(self, combo_box, labels, values):
+        """Add translated labels to a combo box, keeping the internal value as item data."""
+        for label, value in zip(labels, values):
+            combo_box.addItem(label, value)
     
     def _set_angle_unit_combo(self, combo_box, internal_value):
-        """Set combo box to show translated text for internal English value."""
-        if internal_value == "degrees":
-            combo_box.setCurrentText(translations.tr("degrees"))
-        elif internal_value == "radians":
-            combo_box.setCurrentText(translations.tr("radians"))
-        else:
-            combo_box.setCurrentText(translations.tr("radians"))  # Default
+        """Select the item for an internal English value, radians by default."""
+        values = self.ANGLE_VALUES
+        combo_box.setCurrentIndex(values.index(internal_value) if internal_value in values else 1)
     
     def _set_scale_combo(self, combo_box, internal_value):
-        """Set combo box to show translated text for internal English value."""
-        if internal_value == "dB":
-            combo_box.setCurrentText(translations.tr("db"))
-        elif internal_value == "linear":
-            combo_box.setCurrentText(translations.tr("linear"))
-        else:
-            combo_box.setCurrentText(translations.tr("db"))  # Default
+        """Select the item for an internal English value, dB by default."""
+        values = self.SCALE_VALUES
+        combo_box.setCurrentIndex(values.index(internal_value) if internal_value in values else 0)
     
     def get_values(self):
-        """Get the values from the dialog, converting UI text to internal English values."""
-        return {
-            'precision_decimals': self.precision_spin.value(),
-            'angle_unit_input': self._get_angle_unit_value(self.angle_input_combo),
-            'angle_unit_rectangular': self._get_angle_unit_value(self.angle_rect_combo),
-            'angle_unit_polar': self._get_angle_unit_value(self.angle_polar_combo),
-            'element_phase_unit': self._get_angle_unit_value(self.element_phase_combo),
-            'rectangular_scale': self._get_scale_value(self.rectangular_scale_combo),
-            'polar_scale': self._get_scale_value(self.polar_scale_combo),
-            'resolution': self.resolution_spin.value(),
-            'threshold_db': self.threshold_spin.value(),
-            'normalize_array_factor': self.normalize_checkbox.isChecked()
-        }
+        """Get the values from the dialog as internal English values."""
+        return {key: self._get_field_value(getattr(self, widget_name), kind)
+                for widget_name, key, kind in self._FIELDS}
+    
+    def _get_field_value(self, widget, kind):
+        """Read a field widget according to its kind."""
+        match kind:
+            case 'spin':
+                return widget.value()
+            case 'angle':
+                return self._get_angle_unit_value(widget)
+            case 'scale':
+                return self._get_scale_value(widget)
+            case 'bool':
+                return widget.isChecked()
     
     def _get_angle_unit_value(self, combo_box):
-        """Convert combo box text to internal English angle unit value."""
-        current_text = combo_box.currentText()
-        if current_text == translations.tr("degrees"):
-            return "degrees"
-        elif current_text == translations.tr("radians"):
-            return "radians"
-        else:
-            return "radians"  # Default fallback
+        """Get the internal English angle unit value of the selected item."""
+        return combo_box.currentData() or "radians"
     
     def _get_scale_value(self, combo_box):
-        """Convert combo box text to internal English scale value."""
-        current_text = combo_box.currentText()
-        if current_text == translations.tr("db"):
-            return "dB"
-        elif current_text == translations.tr("linear"):
-            return "linear"
-        else:
-            return "dB"  # Default fallback
+        """Get the internal English scale value of the selected item."""
+        return combo_box.currentData() or "dB"
 
-class ComputationWorker(QObject):
-    """Worker thread for computation to avoid UI freezing."""
-    finished = Signal(dict)
+class WorkerSignals(QObject):
+    """Signals for the pooled workers, which are not QObjects themselves."""
+    # object passes the results dict by reference; dict would go through a QVariantMap copy
+    finished = Signal(object)
     error = Signal(str)
+
+
+class ComputationWorker(QRunnable):
+    """Pooled task for computation to avoid UI freezing."""
     
     def __init__(self, method, params):
         super().__init__()
         self.method = method
         self.params = params
+        self.signals = WorkerSignals()
     
     def run(self):
         try:
             result = self.method.compute(**self.params)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+class CsvExportWorker(QRunnable):
+    """Pooled task writing the array factor CSV, so large exports don't block the GUI."""
+    
+    def __init__(self, filename, columns, precision):
+        super().__init__()
+        self.filename = filename
+        self.columns = columns
+        self.precision = precision
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            _write_array_factor_csv(self.filename, self.columns, self.precision)
+            self.signals.finished.emit(self.filename)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -257,17 +450,14 @@ class MainWindow(QMainWindow):
         self.config_manager = ConfigManager()
         
         # Initialize methods
-        self.methods = {
-            'Schelkunoff': SchelkunoffMethod(),
-            'Fourier': FourierMethod(),
-            'DolphChebyshev': DolphChebyshevMethod()
-        }
+        self.methods = _build_methods()
         
         # Load global parameters from configuration
         self.load_global_parameters()
         
-        # Current results
+        # Current results and the plotting parameters they were drawn with
         self.current_results = None
+        self._results_plotting_params: Dict[str, Any] = {}
         
         # Store initial dock states for reset functionality
         self.initial_dock_states = {}
@@ -275,36 +465,58 @@ class MainWindow(QMainWindow):
         # Initialize plot manager for detachable plots
         self.plot_manager = PlotManager(self)
         
+        # Dialogs are built on first use and reused across openings
+        self._global_params_dialog = None
+        self._preferences_dialog = None
+        
+        # Plot id of each canvas offering the detach context menu
+        self._canvas_plot_ids: Dict[QWidget, str] = {}
+        
+        # Key of the data shown in the coefficients table, to skip identical refreshes
+        self._coefficients_key: Optional[tuple] = None
+        
+        # Input groups built per method, reused when switching back to it
+        self._method_widget_cache: Dict[str, Dict[str, Any]] = {}
+        # Output groups per method; they hold no state, so they are always reused
+        # and only their texts follow language and width changes
+        self._output_group_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Label key of each input, per (method, angle unit); input definitions are static
+        self._label_key_cache: Dict[tuple, Dict[str, str]] = {}
+        
+        # Debounce timer for rebuilding input widgets after a resize
+        self._last_rebuild_width = self.initial_geometry[2]
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._do_resize_rebuild)
+        
         self.setup_ui()
         self.setup_menu()
         
         # Apply initial font size from config
-        config = self.config_manager.load_config()
+        config = self.config_manager.load_config_readonly()
         initial_font_size = config.get('font_size', 12)
         self.current_font_size = initial_font_size
         self.update_font_size(initial_font_size)
         self.setup_docks()
         
         # Initialize with last used method or first method after everything is setup
-        if hasattr(self, 'method_combo'):
-            if self.last_method and self.last_method in self.methods:
-                # Set the combo to the last used method by finding its index
-                for i in range(self.method_combo.count()):
-                    if self.method_combo.itemData(i) == self.last_method:
-                        self.method_combo.setCurrentIndex(i)
-                        break
-                self.initial_method = self.last_method
-            else:
-                self.initial_method = self.method_combo.currentData()
-            
-            self.method_changed(self.initial_method)
-            # Store initial input values after widgets are created
-            if hasattr(self, 'input_widgets'):
-                self.initial_input_values = self.get_input_values(validate_expressions=False)
+        idx = self._method_index.get(self.last_method)
+        if idx is not None:
+            self.method_combo.setCurrentIndex(idx)
+            self.initial_method = self.last_method
+        else:
+            self.initial_method = self.method_combo.currentData()
+        
+        self.method_changed(self.initial_method)
+        # Store initial input values after widgets are created
+        if hasattr(self, 'input_widgets'):
+            self.initial_input_values = self.get_input_values(validate_expressions=False)
     
     def load_global_parameters(self):
         """Load global parameters from configuration file."""
-        config = self.config_manager.load_config()
+        config = self.config_manager.load_config_readonly()
         
         self.precision_decimals = config['precision_decimals']
         self.angle_unit_input = config['angle_unit_input']
@@ -316,12 +528,23 @@ class MainWindow(QMainWindow):
         self.resolution = config['resolution']
         self.threshold_db = config['threshold_db']
         self.normalize_array_factor = config['normalize_array_factor']
+        # Plotting parameters are rebuilt from these on next use
+        self._plotting_params_cache = None
+        # Input values and layout type for the plots; dropped whenever an input changes
+        self._plotting_inputs_cache: Optional[tuple] = None
         
         # Initialize method state for current session only (don't load from previous sessions)
         self.last_method = None
         self.last_method_inputs = {}
         # Store method inputs for current session only
         self.session_method_inputs = {}
+        # Input name of each input widget, so a change updates just its own entry
+        self._input_widget_names: Dict[QWidget, str] = {}
+        # Coalesce bursts of full snapshots into a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(100)
+        self._save_timer.timeout.connect(self._do_save_state)
     
     def save_global_parameters(self):
         """Save current global parameters to configuration file."""
@@ -340,28 +563,32 @@ class MainWindow(QMainWindow):
         
         self.config_manager.save_config(config)
     
+    def closeEvent(self, event):
+        """Write pending configuration changes and let a running computation finish."""
+        self.config_manager.flush()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(event)
+    
     def resizeEvent(self, event):
         """Handle window resize events to update label wrapping."""
         super().resizeEvent(event)
-        # Recreate widgets with new wrapping when window is resized significantly
-        old_width = event.oldSize().width() if event.oldSize().isValid() else 0
-        new_width = event.size().width()
-        
-        # Only refresh if width change is significant (more than 100 pixels)
-        if abs(new_width - old_width) > 100 and hasattr(self, 'method_combo'):
-            current_method_key = self.method_combo.currentData()
-            if current_method_key in self.methods:
-                # Store current input values before recreating widgets
-                current_values = {}
-                if hasattr(self, 'input_widgets'):
-                    current_values = self.get_input_values(validate_expressions=False)
-                
-                # Recreate widgets with new adaptive wrapping
-                self.method_changed(current_method_key)
-                
-                # Restore input values
-                if current_values:
-                    self.set_input_values(current_values)
+        # Only refresh if width changed significantly (more than 100 pixels) since the last rebuild
+        if abs(event.size().width() - self._last_rebuild_width) <= 100:
+            return
+        # Coalesce the burst of events from a drag-resize into a single rebuild
+        self._resize_timer.start()
+    
+    def _do_resize_rebuild(self):
+        """Recreate input widgets with new wrapping once resizing has settled."""
+        new_width = self.width()
+        if abs(new_width - self._last_rebuild_width) <= 100:
+            return
+        self._last_rebuild_width = new_width
+        current_method_key = self.method_combo.currentData()
+        if current_method_key in self.methods:
+            # Recreate widgets with new adaptive wrapping, carrying over the inputs
+            current_values = self.get_input_values(validate_expressions=False) if hasattr(self, 'input_widgets') else None
+            self.method_changed(current_method_key, preset_values=current_values)
     
     def set_input_values(self, values: Dict[str, Any]):
         """Set values in input widgets."""
@@ -387,81 +614,104 @@ class MainWindow(QMainWindow):
         
         expression = expression.strip().lower()
         
+        # Common angles are a single lookup
+        hit = _COMMON_PI_EXPRS.get(expression)
+        if hit is not None:
+            return hit
+        
         # Handle simple numbers
         try:
             return float(expression)
         except ValueError:
             pass
         
-        # Replace 'pi' with np.pi for evaluation
-        expression = expression.replace('pi', str(np.pi))
-        
-        # Simple validation - only allow numbers, operators, parentheses, and pi
-        if re.match(r'^[0-9+\-*/().\s' + str(np.pi).replace('.', r'\.') + r']+$', expression):
-            try:
-                return float(eval(expression))
-            except:
-                raise ValueError(f"Invalid expression: {expression}")
-        else:
+        # Reject anything outside the allowed character set before parsing
+        if not _PI_EXPR_RE.match(expression):
             raise ValueError(f"Invalid characters in expression: {expression}")
+        
+        # Evaluate arithmetic over numbers and pi without eval()
+        return _eval_pi_expression(expression)
+    
+    def parse_pi_list(self, text: str) -> List[float]:
+        """Parse a comma-separated list of angles such as 'pi/3, 2*pi/3, 1.2'.
+        
+        Entries of the form 'a*pi/b' are evaluated together with NumPy; any other
+        entry goes through parse_pi_expression.
+        """
+        entries = [entry.strip().lower() for entry in text.split(',')]
+        entries = [entry for entry in entries if entry]
+        
+        values = np.empty(len(entries))
+        signs, coefficients, divisors, term_positions = [], [], [], []
+        for position, entry in enumerate(entries):
+            match = _PI_TERM_RE.match(entry)
+            if match and float(match.group(3) or 1) != 0:
+                sign, coefficient, divisor = match.groups()
+                signs.append(-1.0 if sign == '-' else 1.0)
+                coefficients.append(float(coefficient or 1))
+                divisors.append(float(divisor or 1))
+                term_positions.append(position)
+            else:
+                values[position] = self.parse_pi_expression(entry)
+        
+        if term_positions:
+            values[term_positions] = np.array(signs) * np.array(coefficients) * np.pi / np.array(divisors)
+        return values.tolist()
     
     def setup_menu(self):
         """Setup the menu bar."""
         menubar = self.menuBar()
         
-        # Edit menu
-        edit_menu = menubar.addMenu(translations.tr('edit'))
-        
         # Global parameters action
-        global_params_action = edit_menu.addAction(translations.tr('global_parameters'))
+        global_params_action = QAction(translations.tr('global_parameters'), self)
         global_params_action.triggered.connect(self.show_global_parameters_dialog)
         
         # Preferences action
-        preferences_action = edit_menu.addAction(translations.tr('preferences'))
+        preferences_action = QAction(translations.tr('preferences'), self)
         preferences_action.triggered.connect(self.show_preferences_dialog)
         
-        # Export menu
-        export_menu = menubar.addMenu(translations.tr('export'))
-        
-        # Export plots submenu
-        plots_menu = export_menu.addMenu(translations.tr('export_plots'))
-        
         # PNG export
-        png_action = plots_menu.addAction(translations.tr('export_as_png'))
+        png_action = QAction(translations.tr('export_as_png'), self)
         png_action.triggered.connect(lambda: self.export_plots_dialog('png'))
         
         # SVG export
-        svg_action = plots_menu.addAction(translations.tr('export_as_svg'))
+        svg_action = QAction(translations.tr('export_as_svg'), self)
         svg_action.triggered.connect(lambda: self.export_plots_dialog('svg'))
         
-        # Export data
-        export_menu.addSeparator()
-        
         # JSON export
-        json_action = export_menu.addAction(translations.tr('export_data_json'))
+        json_action = QAction(translations.tr('export_data_json'), self)
         json_action.triggered.connect(self.export_json_dialog)
         
         # CSV export
-        csv_action = export_menu.addAction(translations.tr('export_array_factor_csv'))
+        csv_action = QAction(translations.tr('export_array_factor_csv'), self)
         csv_action.triggered.connect(self.export_csv_dialog)
         
-        # View menu
-        view_menu = menubar.addMenu(translations.tr('view'))
-        
-        # Appearance submenu
-        appearance_menu = view_menu.addMenu(translations.tr('appearance'))
-        
         # Reset view action
-        reset_view_action = appearance_menu.addAction(translations.tr('reset_view'))
+        reset_view_action = QAction(translations.tr('reset_view'), self)
         reset_view_action.triggered.connect(self.reset_view)
         
-        # Plots submenu
-        plots_view_menu = view_menu.addMenu(translations.tr('plots'))
-        
         # Reattach all plots action
-        reattach_all_action = plots_view_menu.addAction(translations.tr('reattach_all_plots'))
+        reattach_all_action = QAction(translations.tr('reattach_all_plots'), self)
         reattach_all_action.triggered.connect(self.reattach_all_plots)
         
+        # Edit menu
+        edit_menu = menubar.addMenu(translations.tr('edit'))
+        edit_menu.addActions([global_params_action, preferences_action])
+        
+        # Export menu with plots submenu, then data exports
+        export_menu = menubar.addMenu(translations.tr('export'))
+        plots_menu = export_menu.addMenu(translations.tr('export_plots'))
+        plots_menu.addActions([png_action, svg_action])
+        export_menu.addSeparator()
+        export_menu.addActions([json_action, csv_action])
+        
+        # View menu with appearance and plots submenus
+        view_menu = menubar.addMenu(translations.tr('view'))
+        appearance_menu = view_menu.addMenu(translations.tr('appearance'))
+        appearance_menu.addActions([reset_view_action])
+        plots_view_menu = view_menu.addMenu(translations.tr('plots'))
+        plots_view_menu.addActions([reattach_all_action])
+        
         # Store menu references for language updates
         self.edit_menu = edit_menu
         self.export_menu = export_menu
@@ -479,10 +729,31 @@ class MainWindow(QMainWindow):
         self.csv_action = csv_action
         self.reset_view_action = reset_view_action
         self.reattach_all_action = reattach_all_action
+        
+        # (object, setter name, translation key) for language updates
+        self._i18n_targets = [
+            (edit_menu, 'setTitle', 'edit'),
+            (export_menu, 'setTitle', 'export'),
+            (view_menu, 'setTitle', 'view'),
+            (plots_menu, 'setTitle', 'export_plots'),
+            (appearance_menu, 'setTitle', 'appearance'),
+            (plots_view_menu, 'setTitle', 'plots'),
+            (global_params_action, 'setText', 'global_parameters'),
+            (preferences_action, 'setText', 'preferences'),
+            (png_action, 'setText', 'export_as_png'),
+            (svg_action, 'setText', 'export_as_svg'),
+            (json_action, 'setText', 'export_data_json'),
+            (csv_action, 'setText', 'export_array_factor_csv'),
+            (reset_view_action, 'setText', 'reset_view'),
+            (reattach_all_action, 'setText', 'reattach_all_plots'),
+        ]
     
     def show_global_parameters_dialog(self):
         """Show the global parameters dialog."""
-        dialog = GlobalParametersDialog(self)
+        if self._global_params_dialog is None:
+            self._global_params_dialog = GlobalParametersDialog(self)
+        dialog = self._global_params_dialog
+        dialog.load_current_values()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Update parameters with new values
             values = dialog.get_values()
@@ -490,89 +761,55 @@ class MainWindow(QMainWindow):
     
     def show_preferences_dialog(self):
         """Show the preferences dialog."""
-        dialog = PreferencesDialog(self)
-        # Connect signals
-        dialog.language_changed.connect(self.update_language)
-        dialog.font_size_changed.connect(self.update_font_size)
-        dialog.exec()
+        if self._preferences_dialog is None:
+            self._preferences_dialog = PreferencesDialog(self)
+            # Connect signals
+            self._preferences_dialog.language_changed.connect(self.update_language)
+            self._preferences_dialog.font_size_changed.connect(self.update_font_size)
+        else:
+            self._preferences_dialog.load_current_values()
+        self._preferences_dialog.exec()
+    
+    def _invalidate_global_params_dialog(self):
+        """Drop the cached global parameters dialog so it is rebuilt on next open."""
+        if self._global_params_dialog is not None:
+            self._global_params_dialog.deleteLater()
+            self._global_params_dialog = None
     
     def update_font_size(self, font_size: int):
         """Update font size for all UI elements."""
         # Store current font size for persistence
         self.current_font_size = font_size
         
+        # Cached dialog is rebuilt with the new font on next open
+        self._invalidate_global_params_dialog()
+        
         # Create font object
         font = self.font()
         font.setPointSize(font_size)
         
-        # Apply to all UI elements
-        self.update_all_widgets_font(font)
-        
-        # Update menu bar font
-        if hasattr(self, 'menuBar'):
-            self.menuBar().setFont(font)
-            for menu in self.menuBar().findChildren(QWidget):
-                menu.setFont(font)
-    
-    def update_all_widgets_font(self, font):
-        """Apply font to all widget types."""
-        # Input widgets
-        widget_types = [QSpinBox, QDoubleSpinBox, QComboBox, QLineEdit, 
-                       QTextEdit, QLabel, QPushButton, QCheckBox]
-        
-        for widget_type in widget_types:
-            for widget in self.findChildren(widget_type):
-                widget.setFont(font)
-        
-        # Apply to group boxes and their titles
-        for groupbox in self.findChildren(QGroupBox):
-            groupbox.setFont(font)
-        
-        # Apply to tab widgets
-        for tabwidget in self.findChildren(QTabWidget):
-            tabwidget.setFont(font)
-        
-        # Apply to table widgets (for coefficients table)
-        for table in self.findChildren(QTableWidget):
-            table.setFont(font)
-            # Also update header fonts
-            if table.horizontalHeader():
-                table.horizontalHeader().setFont(font)
-            if table.verticalHeader():
-                table.verticalHeader().setFont(font)
+        # Child widgets inherit the window font; the few that do not get it explicitly
+        self.setFont(font)
+        for widget in self._widgets_not_inheriting_font():
+            widget.setFont(font)
+    
+    def _widgets_not_inheriting_font(self):
+        """Yield the widgets that do not follow the window font.
+        
+        Menus, dialogs and detached plots are top-level windows, and the compute
+        button takes its font from its style sheet.
+        """
+        yield from self.menuBar().findChildren(QMenu)
+        if self._preferences_dialog is not None:
+            yield self._preferences_dialog
+        yield from self.plot_manager.detached_plots.values()
+        if hasattr(self, 'compute_button'):
+            yield self.compute_button
     
     def update_menu_language(self):
         """Update menu language without recreating them."""
-        if hasattr(self, 'edit_menu'):
-            self.edit_menu.setTitle(translations.tr('edit'))
-        if hasattr(self, 'export_menu'):
-            self.export_menu.setTitle(translations.tr('export'))
-        if hasattr(self, 'view_menu'):
-            self.view_menu.setTitle(translations.tr('view'))
-        if hasattr(self, 'plots_menu'):
-            self.plots_menu.setTitle(translations.tr('export_plots'))
-        if hasattr(self, 'appearance_menu'):
-            self.appearance_menu.setTitle(translations.tr('appearance'))
-        
-        # Update action texts
-        if hasattr(self, 'global_params_action'):
-            self.global_params_action.setText(translations.tr('global_parameters'))
-        if hasattr(self, 'preferences_action'):
-            self.preferences_action.setText(translations.tr('preferences'))
-        if hasattr(self, 'png_action'):
-            self.png_action.setText(translations.tr('export_as_png'))
-        if hasattr(self, 'svg_action'):
-            self.svg_action.setText(translations.tr('export_as_svg'))
-        if hasattr(self, 'json_action'):
-            self.json_action.setText(translations.tr('export_data_json'))
-        if hasattr(self, 'csv_action'):
-            self.csv_action.setText(translations.tr('export_array_factor_csv'))
-        if hasattr(self, 'reset_view_action'):
-            self.reset_view_action.setText(translations.tr('reset_view'))
-        if hasattr(self, 'plots_view_menu'):
-            self.plots_view_menu.setTitle(translations.tr('plots'))
-        if hasattr(self, 'reattach_all_action'):
-            self.reattach_all_action.setText(translations.tr('reattach_all_plots'))
+        for obj, setter, key in self._i18n_targets:
+            getattr(obj, setter)(translations.tr(key))
     
     def update_global_parameters(self, values: Dict[str, Any]):
         """
@@ -595,20 +832,21 @@ class MainWindow(QMainWindow):
         self.resolution = values['resolution']
         self.threshold_db = values['threshold_db']
         self.normalize_array_factor = values['normalize_array_factor']
+        self._plotting_params_cache = None
 
         # Save the updated parameters to configuration file
         self.save_global_parameters()
 
-        # Clear plots and results since parameters changed
-        if hasattr(self, 'plotting_widget'):
-            self.plotting_widget.clear_plots()
-        if hasattr(self, 'coefficients_table'):
+        # Clear plots and results since parameters changed (nothing to clear before a compute)
+        if self.current_results is not None:
+            self.plotting_widget.clear_plots(redraw=False)
             self.clear_coefficients_table()
-        self.current_results = None
+            self.current_results = None
 
         # Get the current method key to refresh its view
         current_method_key = self.method_combo.currentData()
         if not current_method_key:
+            self.plotting_widget.redraw_plots()
             return
         
         # Decide whether to restore or not, based on whether the unit changed.
@@ -619,9 +857,17 @@ class MainWindow(QMainWindow):
     
     def update_language(self, _language_code: str):
         """Update the UI language."""
+        # Translated text in the cached dialog is built at construction time
+        self._invalidate_global_params_dialog()
+        
         # Update window title
         self.setWindowTitle(translations.tr("main_window_title"))
         
+        # Coefficient table headers are cached per language
+        self.coefficients_model.retranslate()
+        if hasattr(self, 'coefficients_placeholder'):
+            self.coefficients_placeholder.setText(translations.tr("not_computed_yet"))
+        
         # Update menu bar
         self.update_menu_language()
         
@@ -637,15 +883,9 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'method_group'):
                 self.method_group.setTitle(translations.tr("method_selection"))
             
-            # Update method combo box items
-            self.method_combo.clear()
-            for method_key, method_instance in self.methods.items():
-                method_name = method_instance.name  # Use the actual name property
-                self.method_combo.addItem(method_name, method_key)
-            
-            # Restore selection
-            if current_index >= 0:
-                self.method_combo.setCurrentIndex(current_index)
+            # Rename the method combo items in place; keys, order and selection are unchanged
+            for method_key, index in self._method_index.items():
+                self.method_combo.setItemText(index, self.methods[method_key].name)
             
             # Update compute button
             if hasattr(self, 'compute_button'):
@@ -656,26 +896,15 @@ class MainWindow(QMainWindow):
                 self.tab_widget.setTabText(0, translations.tr("array_factor"))
                 self.tab_widget.setTabText(1, translations.tr("array_elements"))
             
-            # Refresh current method to update input/output labels
+            # Refresh current method to update input/output labels, carrying over the inputs
             if current_method:
-                # Store current input values before refreshing widgets
-                current_values = {}
-                if hasattr(self, 'input_widgets'):
-                    current_values = self.get_input_values()
-                
-                self.method_changed(current_method)
-                
-                # Restore input values after widgets are recreated
-                if current_values:
-                    self.set_input_values(current_values)
+                current_values = self.get_input_values(validate_expressions=False) if hasattr(self, 'input_widgets') else None
+                self.method_changed(current_method, preset_values=current_values)
         
         # Update plots if there are current results
         if self.current_results and hasattr(self, 'plotting_widget'):
-            # 1. Create the dictionary of global parameters for plotting.
-            plotting_params = self._get_plotting_parameters()
-            
-            # 2. Call update_plots with the new, correct signature.
-            self.plotting_widget.update_plots(self.current_results, plotting_params)
+            # Redraw with the parameters the results were computed with
+            self.plotting_widget.update_plots(self.current_results, self._results_plotting_params)
         
     def setup_ui(self):
         """Setup the user interface."""
@@ -725,10 +954,13 @@ class MainWindow(QMainWindow):
         method_layout = QVBoxLayout(self.method_group)
         
         self.method_combo = QComboBox()
-        # Add method names using their name property
-        for method_key, method_instance in self.methods.items():
-            method_name = method_instance.name  # Use the actual name property
-            self.method_combo.addItem(method_name, method_key)  # Store original key as data
+        # Add method names using their name property in one batch, storing the original key as data
+        with QSignalBlocker(self.method_combo):
+            self.method_combo.addItems([method_instance.name for method_instance in self.methods.values()])
+            for index, method_key in enumerate(self.methods):
+                self.method_combo.setItemData(index, method_key)
+        # Method key -> combo index, so selecting a method needs no scan
+        self._method_index = {method_key: index for index, method_key in enumerate(self.methods)}
         self.method_combo.currentIndexChanged.connect(self.method_changed_by_index)
         method_layout.addWidget(self.method_combo)
         
@@ -776,26 +1008,65 @@ class MainWindow(QMainWindow):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create tabs
-        self.create_array_factor_tab()
-        self.create_array_elements_tab()
-        self.create_excitation_coefficients_tab()
+        # Coefficients are kept in the model even while the table tab is not built
+        self.coefficients_model = CoefficientsTableModel(self)
+        
+        # Tabs start as placeholders and are built the first time they are shown
+        self._tab_builders = {
+            0: self.create_array_factor_tab,
+            1: self.create_array_elements_tab,
+            2: self.create_excitation_coefficients_tab,
+        }
+        for title_key in ("array_factor", "array_elements", "excitation_coefficients"):
+            self.tab_widget.addTab(QWidget(), translations.tr(title_key))
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
         
         return self.tab_widget
     
+    def _ensure_tab_built(self, index: int):
+        """Replace the placeholder at index with the real tab if not built yet."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        placeholder = self.tab_widget.widget(index)
+        with QSignalBlocker(self.tab_widget):
+            current_index = self.tab_widget.currentIndex()
+            title = self.tab_widget.tabText(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, builder(), title)
+            self.tab_widget.setCurrentIndex(current_index)
+        placeholder.deleteLater()
+        
+        # Plots drawn before this tab existed went to the plotting widget's own figures
+        if hasattr(self, 'plotting_widget') and self._link_plot_figures():
+            if self.current_results:
+                self.plotting_widget.update_plots(self.current_results, self._results_plotting_params)
+            else:
+                self.plotting_widget.clear_plots()
+    
+    def _ensure_all_tabs_built(self):
+        """Build every tab still pending, for actions that need all the plots."""
+        for index in list(self._tab_builders):
+            self._ensure_tab_built(index)
+    
     def create_array_factor_tab(self):
         """Create Array Factor tab with independently resizable rectangular and polar plots."""
+        from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+        
         tab_widget = QWidget()
         layout = QVBoxLayout(tab_widget)
         
         # Create figures for this tab
-        self.af_figure = Figure(figsize=(10, 4))
-        self.af_canvas = FigureCanvas(self.af_figure)
+        self.af_figure = Figure(figsize=(10, 4), layout='none')
+        self.af_canvas = ResizeDebouncedCanvas(self.af_figure)
         # Create navigation toolbar for rectangular plot
         af_toolbar = NavigationToolbar(self.af_canvas, self)
         
-        self.polar_figure = Figure(figsize=(8, 6))
-        self.polar_canvas = FigureCanvas(self.polar_figure)
+        self.polar_figure = Figure(figsize=(8, 6), layout='none')
+        self.polar_canvas = ResizeDebouncedCanvas(self.polar_figure)
         # Create navigation toolbar for polar plot
         polar_toolbar = NavigationToolbar(self.polar_canvas, self)
         
@@ -813,15 +1084,8 @@ class MainWindow(QMainWindow):
         polar_container_layout.addWidget(self.polar_canvas)
         
         # Add context menus for detaching
-        self.af_canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.af_canvas.customContextMenuRequested.connect(
-            lambda pos: self.show_plot_context_menu(pos, 'array_factor', self.af_canvas)
-        )
-        
-        self.polar_canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.polar_canvas.customContextMenuRequested.connect(
-            lambda pos: self.show_plot_context_menu(pos, 'polar', self.polar_canvas)
-        )
+        self._register_plot_canvas(self.af_canvas, 'array_factor')
+        self._register_plot_canvas(self.polar_canvas, 'polar')
         
         # Create splitter for independent resizing of plots
         af_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -836,17 +1100,19 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(af_splitter)
         
-        # Add tab
-        self.tab_widget.addTab(tab_widget, translations.tr("array_factor"))
+        return tab_widget
     
     def create_array_elements_tab(self):
         """Create Array Elements tab with independently resizable excitations plot and elements plot."""
+        from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+        
         tab_widget = QWidget()
         layout = QVBoxLayout(tab_widget)
         
         # Excitations plot
-        self.excitations_figure = Figure(figsize=(8, 4))
-        self.excitations_canvas = FigureCanvas(self.excitations_figure)
+        self.excitations_figure = Figure(figsize=(8, 4), layout='none')
+        self.excitations_canvas = ResizeDebouncedCanvas(self.excitations_figure)
         # Create navigation toolbar for excitations plot
         excitations_toolbar = NavigationToolbar(self.excitations_canvas, self)
         
@@ -858,9 +1124,11 @@ class MainWindow(QMainWindow):
         excitations_container_layout.addWidget(self.excitations_canvas)
         
         # Elements plot
-        self.elements_figure = Figure(figsize=(12, 6))
-        self.elements_canvas = FigureCanvas(self.elements_figure)
+        self.elements_figure = Figure(figsize=(12, 6), layout='none')
+        self.elements_canvas = ResizeDebouncedCanvas(self.elements_figure)
         self.elements_canvas.setMinimumHeight(300)
+        # The Agg buffer covers the whole canvas, so skip erasing the background
+        self.elements_canvas.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         
         # Create container for elements plot
         self.elements_container = QWidget()
@@ -874,15 +1142,8 @@ class MainWindow(QMainWindow):
         elements_container_layout.addWidget(scroll_area)
         
         # Add context menus for detaching
-        self.excitations_canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.excitations_canvas.customContextMenuRequested.connect(
-            lambda pos: self.show_plot_context_menu(pos, 'excitations', self.excitations_canvas)
-        )
-        
-        self.elements_canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.elements_canvas.customContextMenuRequested.connect(
-            lambda pos: self.show_plot_context_menu(pos, 'elements', self.elements_canvas)
-        )
+        self._register_plot_canvas(self.excitations_canvas, 'excitations')
+        self._register_plot_canvas(self.elements_canvas, 'elements')
         
         # Create splitter for independent resizing of plots
         elements_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -897,8 +1158,7 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(elements_splitter)
         
-        # Add tab
-        self.tab_widget.addTab(tab_widget, translations.tr("array_elements"))
+        return tab_widget
     
     
     def create_excitation_coefficients_tab(self):
@@ -906,62 +1166,67 @@ class MainWindow(QMainWindow):
         tab_widget = QWidget()
         layout = QVBoxLayout(tab_widget)
         
-        # Create table widget for coefficients
-        self.coefficients_table = QTableWidget()
-        self.coefficients_table.setColumnCount(6)  # Index, Magnitude, Phase(°), Phase(rad), Real, Imaginary
-        
-        # Apply current font size if available
-        if hasattr(self, 'current_font_size'):
-            font = self.font()
-            font.setPointSize(self.current_font_size)
-            self.coefficients_table.setFont(font)
-            if self.coefficients_table.horizontalHeader():
-                self.coefficients_table.horizontalHeader().setFont(font)
-            if self.coefficients_table.verticalHeader():
-                self.coefficients_table.verticalHeader().setFont(font)
-        
-        # Set column headers
-        headers = [
-            translations.tr("coefficient_index"),
-            translations.tr("coefficient_magnitude"), 
-            translations.tr("coefficient_phase") + " (°)",
-            translations.tr("coefficient_phase") + " (rad)",
-            translations.tr("coefficient_real"),
-            translations.tr("coefficient_imaginary")
-        ]
-        self.coefficients_table.setHorizontalHeaderLabels(headers)
+        # Create table view for coefficients, backed by a model that formats cells on demand
+        self.coefficients_table = QTableView()
+        self.coefficients_table.setModel(self.coefficients_model)
         
         # Configure table appearance
         self.coefficients_table.setAlternatingRowColors(True)
-        self.coefficients_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.coefficients_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.coefficients_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.coefficients_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
-        # Initially show "not computed" message
-        self.coefficients_table.setRowCount(1)
-        not_computed_item = QTableWidgetItem(translations.tr("not_computed_yet"))
-        not_computed_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.coefficients_table.setItem(0, 0, not_computed_item)
-        self.coefficients_table.setSpan(0, 0, 1, 6)  # Span across all columns
+        # "Not computed" message drawn over the empty table, shown while the model has no rows
+        self.coefficients_placeholder = QLabel(translations.tr("not_computed_yet"))
+        self.coefficients_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.coefficients_placeholder.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        placeholder_layout = QVBoxLayout(self.coefficients_table.viewport())
+        placeholder_layout.addWidget(self.coefficients_placeholder)
+        self.coefficients_model.modelReset.connect(self._update_coefficients_placeholder)
+        self._update_coefficients_placeholder()
         
         layout.addWidget(self.coefficients_table)
         
-        # Add tab
-        self.tab_widget.addTab(tab_widget, translations.tr("excitation_coefficients"))
+        return tab_widget
+    
+    def _update_coefficients_placeholder(self):
+        """Show the 'not computed' message only while there are no coefficients."""
+        self.coefficients_placeholder.setVisible(self.coefficients_model.is_empty())
     
     def setup_docks(self):
         """Setup plotting widget to use the tab figures."""
-        # Create PlottingWidget instance to use its plotting methods
-        self.plotting_widget = PlottingWidget()
-        
-        # Replace the plotting widget's figures with our tab figures
-        self.plotting_widget.af_figure = self.af_figure
-        self.plotting_widget.af_canvas = self.af_canvas
-        self.plotting_widget.polar_figure = self.polar_figure
-        self.plotting_widget.polar_canvas = self.polar_canvas
-        self.plotting_widget.excitations_figure = self.excitations_figure
-        self.plotting_widget.excitations_canvas = self.excitations_canvas
-        self.plotting_widget.elements_figure = self.elements_figure
-        self.plotting_widget.elements_canvas = self.elements_canvas
+        # Create PlottingWidget instance to use its plotting methods; its own
+        # figures are never shown, so skip building them
+        self.plotting_widget = PlottingWidget(defer_figures=True)
+        self._link_plot_figures()
+    
+    def _link_plot_figures(self) -> bool:
+        """
+        Replace the plotting widget's figures with the tab figures built so far.
+        Returns True if any figure was newly linked.
+        """
+        linked = False
+        for name in ("af", "polar", "excitations", "elements"):
+            figure = getattr(self, f"{name}_figure", None)
+            if figure is not None and getattr(self.plotting_widget, f"{name}_figure") is not figure:
+                setattr(self.plotting_widget, f"{name}_figure", figure)
+                setattr(self.plotting_widget, f"{name}_canvas", getattr(self, f"{name}_canvas"))
+                linked = True
+        return linked
+    
+    def _register_plot_canvas(self, canvas, plot_id: str):
+        """Enable the detach/reattach context menu on a plot canvas."""
+        self._canvas_plot_ids[canvas] = plot_id
+        canvas.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        canvas.customContextMenuRequested.connect(self._on_plot_context_menu)
+    
+    @Slot(QPoint)
+    def _on_plot_context_menu(self, position: QPoint):
+        """Show the context menu of the canvas that requested it."""
+        canvas = self.sender()
+        plot_id = self._canvas_plot_ids.get(canvas)
+        if plot_id is not None:
+            self.show_plot_context_menu(position, plot_id, canvas)
     
     def show_plot_context_menu(self, position, plot_id: str, canvas):
         """Show context menu for plot canvas."""
@@ -982,6 +1247,7 @@ class MainWindow(QMainWindow):
     
     def detach_plot(self, plot_id: str):
         """Detach a plot from the main window."""
+        self._ensure_all_tabs_built()
         plot_info = self.get_plot_info(plot_id)
         if plot_info:
             self.plot_manager.detach_plot(
@@ -1032,11 +1298,9 @@ class MainWindow(QMainWindow):
         
         # Reset to initial method
         if hasattr(self, 'initial_method') and hasattr(self, 'method_combo'):
-            # Find the index for the initial method
-            for i in range(self.method_combo.count()):
-                if self.method_combo.itemData(i) == self.initial_method:
-                    self.method_combo.setCurrentIndex(i)
-                    break
+            idx = self._method_index.get(self.initial_method)
+            if idx is not None:
+                self.method_combo.setCurrentIndex(idx)
             self.method_changed(self.initial_method)
             
             # Reset input values to initial defaults
@@ -1051,8 +1315,9 @@ class MainWindow(QMainWindow):
         self.current_results = None
         
         # Clear output widgets
+        not_computed_text = translations.tr("not_computed_yet")
         for output_widget in self.output_widgets.values():
-            output_widget.setPlainText(translations.tr("not_computed_yet"))
+            output_widget.setPlainText(not_computed_text)
         
     def method_changed_by_index(self, index: int):
         """Handle method selection change by index."""
@@ -1063,36 +1328,41 @@ class MainWindow(QMainWindow):
                 # which is the desired behavior.
                 self.method_changed(method_key)
     
-    def method_changed(self, method_key: str, restore_session_state: bool = True):
-        """Handle method selection change."""
-        self.clear_inputs()
-        self.clear_outputs()
+    def method_changed(self, method_key: str, restore_session_state: bool = True,
+                       preset_values: Optional[Dict[str, Any]] = None):
+        """Handle method selection change.
+        
+        Args:
+            method_key: Key of the method to show.
+            restore_session_state: If True, fill the new widgets from session memory.
+            preset_values: Values to fill the new widgets with instead of the session state.
+        """
+        # The pending snapshot belongs to the method being replaced
+        self._flush_pending_save()
+        
+        # Repaint the panels once, after the groups have been swapped
+        with _updates_disabled(self.inputs_widget, self.outputs_widget):
+            self._show_method_widgets(method_key, reuse=bool(preset_values) or restore_session_state)
+        self.inputs_widget.updateGeometry()
+        self._plotting_inputs_cache = None
         
         # Clear plotting widgets when switching methods
         if hasattr(self, 'plotting_widget'):
             self.plotting_widget.clear_plots()
         
         # Clear coefficients table when switching methods
-        if hasattr(self, 'coefficients_table'):
+        if hasattr(self, 'coefficients_model'):
             self.clear_coefficients_table()
         
         if method_key in self.methods:
-            method = self.methods[method_key]
-            self.create_input_widgets(method)
-            self.create_output_widgets(method)
-                        
-            # Only restore state if the caller requests it
-            if restore_session_state:
+            # Populate the new widgets once: preset values win over session state
+            if preset_values:
+                self.set_input_values(preset_values)
+            elif restore_session_state:
                 saved_inputs = self.session_method_inputs.get(method_key, {})
                 if saved_inputs and hasattr(self, 'input_widgets'):
                     self.set_input_values(saved_inputs)
             
-            # Reapply current font size to new widgets
-            if hasattr(self, 'current_font_size'):
-                font = self.font()
-                font.setPointSize(self.current_font_size)
-                self.update_all_widgets_font(font)
-            
             # Clear any results (elements plot will be cleared by plotting_widget.clear_plots())
             self.current_results = None
             
@@ -1103,57 +1373,122 @@ class MainWindow(QMainWindow):
                 current_inputs = self.get_input_values(validate_expressions=False) if hasattr(self, 'input_widgets') else {}
                 self.save_method_session_state(current_method_key, current_inputs)
             
+    def _show_method_widgets(self, method_key: str, reuse: bool):
+        """
+        Replace the input/output groups with those of the given method.
+        
+        Input groups built earlier for the method are shown again if reuse is True and
+        they were built with the current angle unit, language and label width; otherwise
+        they are rebuilt with default values. Output groups are always reused.
+        """
+        self.clear_inputs()
+        self.clear_outputs()
+        
+        signature = (self.angle_unit_input, translations.get_language(), self._get_adaptive_max_length())
+        for key, entry in list(self._method_widget_cache.items()):
+            if entry['signature'] != signature or (key == method_key and not reuse):
+                self._discard_method_widgets(key)
+        
+        if method_key not in self.methods:
+            return
+        
+        self._show_output_widgets(method_key)
+        
+        entry = self._method_widget_cache.get(method_key)
+        if entry is None:
+            self.create_input_widgets(self.methods[method_key])
+            self._method_widget_cache[method_key] = {
+                'signature': signature,
+                'inputs_group': self.inputs_group,
+                'inputs_form': self.inputs_form,
+                'input_widgets': self.input_widgets,
+            }
+            return
+        
+        self.inputs_group = entry['inputs_group']
+        self.inputs_form = entry['inputs_form']
+        self.input_widgets = entry['input_widgets']
+        self.inputs_layout.addWidget(self.inputs_group)
+        self.inputs_group.show()
+    
+    def _show_output_widgets(self, method_key: str):
+        """Show the output group of the given method, creating it on first use."""
+        method = self.methods[method_key]
+        text_signature = (translations.get_language(), self._get_adaptive_max_length())
+        entry = self._output_group_cache.get(method_key)
+        if entry is None:
+            self.create_output_widgets(method)
+            self._output_group_cache[method_key] = {
+                'text_signature': text_signature,
+                'outputs_group': self.outputs_group,
+                'output_widgets': self.output_widgets,
+            }
+            return
+        
+        self.outputs_group = entry['outputs_group']
+        self.output_widgets = entry['output_widgets']
+        if entry['text_signature'] != text_signature:
+            self.retranslate_output_widgets(method)
+            entry['text_signature'] = text_signature
+        not_computed_text = translations.tr("not_computed_yet")
+        for output_widget in self.output_widgets.values():
+            output_widget.setPlainText(not_computed_text)
+        self.outputs_layout.addWidget(self.outputs_group)
+        self.outputs_group.show()
+    
+    def _discard_method_widgets(self, method_key: str):
+        """Delete the cached groups of a method; they must not be in the layouts."""
+        entry = self._method_widget_cache.pop(method_key)
+        for widget in entry['input_widgets'].values():
+            self._input_widget_names.pop(widget, None)
+        entry['inputs_group'].deleteLater()
+    
+    def _is_cached_group(self, widget: QWidget) -> bool:
+        """True if the widget is an input/output group kept for reuse."""
+        return (any(widget is entry['inputs_group'] for entry in self._method_widget_cache.values())
+                or any(widget is entry['outputs_group'] for entry in self._output_group_cache.values()))
+    
     def clear_inputs(self):
         """Clear input widgets."""
+        # Detach and defer deletion; dropping the last Python reference right after
+        # setParent(None) deleted the widget tree synchronously and could corrupt the heap.
+        # Cached groups are only hidden
         for i in reversed(range(self.inputs_layout.count())):
-            self.inputs_layout.itemAt(i).widget().setParent(None)
+            widget = self.inputs_layout.takeAt(i).widget()
+            widget.hide()
+            if not self._is_cached_group(widget):
+                widget.deleteLater()
         self.input_widgets = {}
         
     def clear_outputs(self):
         """Clear output widgets."""
         for i in reversed(range(self.outputs_layout.count())):
-            self.outputs_layout.itemAt(i).widget().setParent(None)
+            widget = self.outputs_layout.takeAt(i).widget()
+            widget.hide()
+            if not self._is_cached_group(widget):
+                widget.deleteLater()
         self.output_widgets = {}
     
     def clear_coefficients_table(self):
         """Clear coefficients table and show 'not computed' message."""
-        # Clear content without clearing headers
-        self.coefficients_table.setRowCount(0)
-        self.coefficients_table.setRowCount(1)
-        self.coefficients_table.setColumnCount(6)
-        
-        # Reset headers
-        headers = [
-            translations.tr("coefficient_index"),
-            translations.tr("coefficient_magnitude"), 
-            translations.tr("coefficient_phase") + " (°)",
-            translations.tr("coefficient_phase") + " (rad)",
-            translations.tr("coefficient_real"),
-            translations.tr("coefficient_imaginary")
-        ]
-        self.coefficients_table.setHorizontalHeaderLabels(headers)
-        
-        # Show "not computed" message
-        not_computed_item = QTableWidgetItem(translations.tr("not_computed_yet"))
-        not_computed_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.coefficients_table.setItem(0, 0, not_computed_item)
-        self.coefficients_table.setSpan(0, 0, 1, 6)
+        self._coefficients_key = None
+        self.coefficients_model.clear()
     
-    def _generate_coefficient_indices(self, n_elements: int, layout_type: str) -> List[int]:
+    def _generate_coefficient_indices(self, n_elements: int, layout_type: str) -> np.ndarray:
         """Generate coefficient indices based on layout type and number of elements."""
         match layout_type:
             case "symmetric":
                 half = n_elements // 2
                 if n_elements % 2 == 0:
                     # Even: [-N/2, ..., -1, 1, ..., N/2]
-                    return list(range(-half, 0)) + list(range(1, half + 1))
+                    return np.concatenate((np.arange(-half, 0), np.arange(1, half + 1)))
                 else:
                     # Odd: [-(N-1)/2, ..., -1, 0, 1, ..., (N-1)/2]
                     half = (n_elements - 1) // 2
-                    return list(range(-half, half + 1))
+                    return np.arange(-half, half + 1)
             case "unilateral" | _:
                 # Default: [0, 1, ..., N-1]
-                return list(range(n_elements))
+                return np.arange(n_elements)
     
     def update_coefficients_table(self, results: Dict[str, Any]):
         """Update coefficients table with computation results."""
@@ -1178,117 +1513,23 @@ class MainWindow(QMainWindow):
         
         n_elements = len(excitations)
         
+        # Nothing to do if the table already shows these coefficients
+        excitations = np.asarray(excitations)
+        data_key = excitations.tobytes() if n_elements < 4096 else id(results['element_excitations'])
+        key = (data_key, layout_type, self.precision_decimals)
+        if key == self._coefficients_key:
+            return
+        self._coefficients_key = key
+        
         # Generate coefficient indices based on layout type
         coefficient_indices = self._generate_coefficient_indices(n_elements, layout_type)
         
-        # Clear existing content and set up table
-        self.coefficients_table.setRowCount(0)  # Clear rows first
-        self.coefficients_table.setRowCount(n_elements)
-        self.coefficients_table.setColumnCount(6)
-        
-        # Reset headers
-        headers = [
-            translations.tr("coefficient_index"),
-            translations.tr("coefficient_magnitude"), 
-            translations.tr("coefficient_phase") + " (°)",
-            translations.tr("coefficient_phase") + " (rad)",
-            translations.tr("coefficient_real"),
-            translations.tr("coefficient_imaginary")
-        ]
-        self.coefficients_table.setHorizontalHeaderLabels(headers)
-        
-        # Populate table
-        for i, (index, excitation) in enumerate(zip(coefficient_indices, excitations)):
-            # Index with Unicode subscript formatting
-            def format_subscript(number):
-                """Convert number to Unicode subscript characters."""
-                subscript_map = {
-                    '0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
-                    '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉',
-                    '-': '₋'
-                }
-                return ''.join(subscript_map.get(char, char) for char in str(number))
-            
-            index_text = f"a{format_subscript(index)}"
-            index_item = QTableWidgetItem(index_text)
-            index_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Use a font that supports mathematical notation well
-            font = QFont()
-            font.setFamily("Times New Roman")
-            font.setPointSize(14)
-            index_item.setFont(font)
-            
-            self.coefficients_table.setItem(i, 0, index_item)
-            
-            # Helper function to format values with "-" for rounded zeros
-            def format_value(value):
-                formatted = f"{value:.{self.precision_decimals}f}"
-                # Check if the formatted value is effectively zero (all zeros after decimal point)
-                if float(formatted) == 0.0:
-                    return "-"
-                return formatted
-            
-            # Magnitude
-            magnitude = abs(excitation)
-            mag_text = format_value(magnitude)
-            mag_item = QTableWidgetItem(mag_text)
-            mag_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.coefficients_table.setItem(i, 1, mag_item)
-            
-            # Phase in degrees
-            phase_deg = np.angle(excitation, deg=True)
-            phase_deg_text = format_value(phase_deg)
-            phase_deg_item = QTableWidgetItem(phase_deg_text)
-            phase_deg_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.coefficients_table.setItem(i, 2, phase_deg_item)
-            
-            # Phase in radians
-            phase_rad = np.angle(excitation, deg=False)
-            phase_rad_text = format_value(phase_rad)
-            phase_rad_item = QTableWidgetItem(phase_rad_text)
-            phase_rad_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.coefficients_table.setItem(i, 3, phase_rad_item)
-            
-            # Real part
-            real_part = excitation.real
-            real_text = format_value(real_part)
-            real_item = QTableWidgetItem(real_text)
-            real_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.coefficients_table.setItem(i, 4, real_item)
-            
-            # Imaginary part
-            imag_part = excitation.imag
-            imag_text = format_value(imag_part)
-            imag_item = QTableWidgetItem(imag_text)
-            imag_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            self.coefficients_table.setItem(i, 5, imag_item)
+        # Hand the excitations to the model; cells are formatted only when shown
+        self.coefficients_model.set_coefficients(excitations, coefficient_indices, self.precision_decimals)
         
     def _wrap_label_text(self, text: str, max_length: int = 30) -> str:
         """Wrap long label text into multiple lines."""
-        if len(text) <= max_length:
-            return text
-            
-        # Find good break points (spaces, commas, parentheses)
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= max_length:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-            
-        return "\n".join(lines)
+        return _wrap_text(text, max_length)
     
     def _get_adaptive_max_length(self) -> int:
         """Get adaptive max length based on window width."""
@@ -1318,7 +1559,8 @@ class MainWindow(QMainWindow):
         # Get current input angle unit
         angle_unit_str = f"({self.angle_unit_input})"
         
-        # First, add base input widgets
+        # First, build the base input widgets and their labels
+        rows = []
         for input_def in method.get_inputs(self.angle_unit_input):
             widget = self.create_input_widget(input_def)
             if widget:
@@ -1344,14 +1586,19 @@ class MainWindow(QMainWindow):
                     label_widget.setToolTip(help_text)
                     widget.setToolTip(help_text)
                 
-                inputs_form.addRow(label_widget, widget)
-                
-                # Connect widget signals to save state when values change
-                self.connect_input_widget_signals(widget)
-                
-                # Special handling for number_of_beams to trigger dynamic inputs
-                if input_def['name'] == 'number_of_beams' and isinstance(widget, QComboBox):
-                    widget.currentTextChanged.connect(lambda text, m=method: self.update_dynamic_inputs(m))
+                rows.append((label_widget, widget, input_def['name']))
+        
+        # Then add all rows to the form in one go
+        for label_widget, widget, _name in rows:
+            inputs_form.addRow(label_widget, widget)
+        
+        for _label_widget, widget, name in rows:
+            # Connect widget signals to save state when values change
+            self.connect_input_widget_signals(widget, name)
+            
+            # Special handling for number_of_beams to trigger dynamic inputs
+            if name == 'number_of_beams' and isinstance(widget, QComboBox):
+                widget.currentTextChanged.connect(lambda text, m=method: self.update_dynamic_inputs(m))
         
         # Store reference to the form and group for dynamic updates
         self.inputs_form = inputs_form
@@ -1373,133 +1620,170 @@ class MainWindow(QMainWindow):
         # Get current values for dynamic input generation
         current_values = self.get_input_values(validate_expressions=False)
         
-        # Remove existing dynamic inputs
-        dynamic_widgets_to_remove = []
-        for name, widget in self.input_widgets.items():
-            if name.startswith('beam_angles_'):
-                dynamic_widgets_to_remove.append(name)
-        
-        # Remove dynamic widgets from form and dictionary
-        for name in dynamic_widgets_to_remove:
-            widget = self.input_widgets[name]
-            # Find and remove the row from the form layout
-            for i in range(self.inputs_form.rowCount()):
-                label_item = self.inputs_form.itemAt(i, QFormLayout.ItemRole.LabelRole)
-                field_item = self.inputs_form.itemAt(i, QFormLayout.ItemRole.FieldRole)
-                if field_item and field_item.widget() == widget:
-                    # Remove both label and field
-                    if label_item:
-                        label_widget = label_item.widget()
-                        if label_widget:
-                            label_widget.setParent(None)
-                    field_widget = field_item.widget()
-                    if field_widget:
-                        field_widget.setParent(None)
-                    break
-            del self.input_widgets[name]
-        
-        # Get dynamic inputs and add them
+        # Get the dynamic inputs the current values call for
         dynamic_inputs = method.get_dynamic_inputs(current_values)
+        wanted_names = {input_def['name'] for input_def in dynamic_inputs}
         angle_unit_str = f"({self.angle_unit_input})"
         
-        for input_def in dynamic_inputs:
-            widget = self.create_input_widget(input_def)
-            if widget:
-                self.input_widgets[input_def['name']] = widget
-                
+        # Swap the rows with painting suspended, so the form is laid out and repainted once
+        with _updates_disabled(self.inputs_group):
+            # Remove only the dynamic inputs that are no longer wanted
+            dynamic_widgets_to_remove = []
+            for name, widget in self.input_widgets.items():
+                if name.startswith('beam_angles_') and name not in wanted_names:
+                    dynamic_widgets_to_remove.append(name)
+            
+            # Remove dynamic widgets from form and dictionary
+            for name in dynamic_widgets_to_remove:
+                widget = self.input_widgets[name]
+                # Take out the label and field of the row and defer their deletion,
+                # like clear_inputs does
+                row = self.inputs_form.takeRow(widget)
+                for item in (row.labelItem, row.fieldItem):
+                    if item is not None and item.widget() is not None:
+                        item.widget().hide()
+                        item.widget().deleteLater()
+                del self.input_widgets[name]
+                self._input_widget_names.pop(widget, None)
+            
+            for input_def in dynamic_inputs:
                 # Use the key to get the translated label
                 label_text = translations.tr(input_def['label_key'])
                 if 'angle' in input_def['name'].lower():
                     label_text += f" {angle_unit_str}"
                 
-                # Create label with proper sizing
-                label_widget = QLabel(label_text)
-                label_widget.setWordWrap(True)
-                label_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)  # Align to top
-                label_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)  # Allow expansion
-                label_widget.setMinimumWidth(150)  # Set minimum width to prevent text cutting
-                label_widget.setMinimumHeight(25)  # Set minimum height to match widgets
+                # Keep an existing row and its value, updating the label if needed
+                # (e.g. 'single beam' becomes 'beam pair 1')
+                existing_widget = self.input_widgets.get(input_def['name'])
+                if existing_widget is not None:
+                    label_widget = self.inputs_form.labelForField(existing_widget)
+                    if label_widget is not None and label_widget.text() != label_text:
+                        label_widget.setText(label_text)
+                    continue
                 
-                # Use the key for the help text (tooltip)
-                if 'help_key' in input_def:
-                    help_text = translations.tr(input_def['help_key'])
-                    label_widget.setToolTip(help_text)
-                    widget.setToolTip(help_text)
-                
-                self.inputs_form.addRow(label_widget, widget)
-                
-                # Connect widget signals to save state when values change
-                self.connect_input_widget_signals(widget)
+                widget = self.create_input_widget(input_def)
+                if widget:
+                    self.input_widgets[input_def['name']] = widget
+                    
+                    # Create label with proper sizing
+                    label_widget = QLabel(label_text)
+                    label_widget.setWordWrap(True)
+                    label_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)  # Align to top
+                    label_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)  # Allow expansion
+                    label_widget.setMinimumWidth(150)  # Set minimum width to prevent text cutting
+                    label_widget.setMinimumHeight(25)  # Set minimum height to match widgets
+                    
+                    # Use the key for the help text (tooltip)
+                    if 'help_key' in input_def:
+                        help_text = translations.tr(input_def['help_key'])
+                        label_widget.setToolTip(help_text)
+                        widget.setToolTip(help_text)
+                    
+                    self.inputs_form.addRow(label_widget, widget)
+                    
+                    # Connect widget signals to save state when values change
+                    self.connect_input_widget_signals(widget, input_def['name'])
+            
+            self.inputs_form.invalidate()
+        self._plotting_inputs_cache = None
         
-    def create_input_widget(self, input_def: Dict[str, Any]) -> QWidget:
-        """Create a single input widget based on definition."""
-        widget_type = input_def['type']
+        # The set of inputs changed, so take a full snapshot of the session state
+        self.on_input_value_changed()
         
-        if widget_type == 'float':
-            widget = QDoubleSpinBox()
+    def _make_float_widget(self, input_def: Dict[str, Any]) -> QWidget:
+        widget = QDoubleSpinBox()
+        with QSignalBlocker(widget):
             min_val = input_def.get('min', -1000) # Store the minimum
             widget.setRange(min_val, input_def.get('max', 1000))
             # Use minimum as fallback for default
-            default_val = input_def.get('default', min_val) 
-            widget.setValue(default_val)
+            widget.setValue(input_def.get('default', min_val))
             widget.setSingleStep(input_def.get('step', 0.1))
             widget.setDecimals(input_def.get('decimals', 2))
-            widget.setMinimumHeight(25)
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            return widget
-            
-        elif widget_type == 'int':
-            widget = QSpinBox()
+        return widget
+    
+    def _make_int_widget(self, input_def: Dict[str, Any]) -> QWidget:
+        widget = QSpinBox()
+        with QSignalBlocker(widget):
             min_val = input_def.get('min', -1000) # Store the minimum
             widget.setRange(min_val, input_def.get('max', 1000))
             # Use minimum as fallback for default
-            default_val = input_def.get('default', min_val) 
-            widget.setValue(default_val)
+            widget.setValue(input_def.get('default', min_val))
             widget.setSingleStep(input_def.get('step', 1))
-            widget.setMinimumHeight(25)
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            return widget
-            
-        elif widget_type == 'choice':
-            widget = QComboBox()
+        return widget
+    
+    def _make_choice_widget(self, input_def: Dict[str, Any]) -> QWidget:
+        widget = QComboBox()
+        with QSignalBlocker(widget):
             widget.addItems(input_def.get('choices', []))
             if 'default' in input_def:
                 widget.setCurrentText(str(input_def['default']))
-            widget.setMinimumHeight(25)  # Set consistent height
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            return widget
-            
-        elif widget_type == 'list_float':
-            widget = QLineEdit()
-            default_list = input_def.get('default', [])
-            widget.setText(', '.join(map(str, default_list)))
-            widget.setMinimumHeight(25)  # Set consistent height
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            return widget
-        
-        elif widget_type == 'text':
-            widget = QLineEdit()
-            widget.setText(input_def.get('default', '')) # Use default as string
-            widget.setMinimumHeight(25)  # Set consistent height
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            return widget
-            
-        # Return a default widget if no matching type
+        return widget
+    
+    def _make_list_float_widget(self, input_def: Dict[str, Any]) -> QWidget:
         widget = QLineEdit()
-        widget.setMinimumHeight(25)  # Set consistent height
+        with QSignalBlocker(widget):
+            widget.setText(', '.join(map(str, input_def.get('default', []))))
+        return widget
+    
+    def _make_text_widget(self, input_def: Dict[str, Any]) -> QWidget:
+        widget = QLineEdit()
+        with QSignalBlocker(widget):
+            widget.setText(input_def.get('default', '')) # Use default as string
+        return widget
+    
+    # Widget factory per input type; unknown types get an empty line edit
+    _INPUT_WIDGET_FACTORIES = {
+        'float': _make_float_widget,
+        'int': _make_int_widget,
+        'choice': _make_choice_widget,
+        'list_float': _make_list_float_widget,
+        'text': _make_text_widget,
+    }
+    
+    def create_input_widget(self, input_def: Dict[str, Any]) -> QWidget:
+        """Create a single input widget based on definition.
+        
+        Default values are set with the widget's signals blocked, so callers may
+        connect signals before or after without receiving change notifications.
+        """
+        factory = self._INPUT_WIDGET_FACTORIES.get(input_def['type'])
+        widget = factory(self, input_def) if factory is not None else QLineEdit()
+        
+        # Consistent height for every row
+        widget.setMinimumHeight(25)
         widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         return widget
     
-    def connect_input_widget_signals(self, widget: QWidget):
+    def connect_input_widget_signals(self, widget: QWidget, name: str):
         """Connect signals from input widgets to save method state when values change."""
-        if isinstance(widget, QDoubleSpinBox):
-            widget.valueChanged.connect(self.on_input_value_changed)
-        elif isinstance(widget, QSpinBox):
-            widget.valueChanged.connect(self.on_input_value_changed)
+        self._input_widget_names[widget] = name
+        if isinstance(widget, (QDoubleSpinBox, QSpinBox)):
+            widget.valueChanged.connect(self._on_spin_changed)
         elif isinstance(widget, QComboBox):
-            widget.currentTextChanged.connect(self.on_input_value_changed)
+            widget.currentTextChanged.connect(self._on_combo_changed)
         elif isinstance(widget, QLineEdit):
-            widget.textChanged.connect(self.on_input_value_changed)
+            widget.textChanged.connect(self._on_line_changed)
+    
+    def _on_spin_changed(self, value):
+        self._store_input_value(self.sender(), value)
+    
+    def _on_combo_changed(self, text: str):
+        self._store_input_value(self.sender(), text)
+    
+    def _on_line_changed(self, text: str):
+        # Same raw value get_input_values(validate_expressions=False) stores
+        self._store_input_value(self.sender(), text.strip())
+    
+    def _store_input_value(self, widget: QWidget, value):
+        """Record a single changed input in the session state of the current method."""
+        self._plotting_inputs_cache = None
+        name = self._input_widget_names.get(widget)
+        # Ignore widgets of groups kept hidden for other methods
+        if name is None or self.input_widgets.get(name) is not widget:
+            return
+        method_key = self.method_combo.currentData()
+        if method_key:
+            self.session_method_inputs.setdefault(method_key, {})[name] = value
     
     def save_method_session_state(self, method_key: str, inputs: dict):
         """Save method state in session memory only (not persistent)."""
@@ -1507,7 +1791,17 @@ class MainWindow(QMainWindow):
             self.session_method_inputs[method_key] = inputs.copy()
     
     def on_input_value_changed(self):
-        """Handle input value changes to save method state."""
+        """Schedule a save of all current inputs, restarting any pending one."""
+        self._save_timer.start()
+    
+    def _flush_pending_save(self):
+        """Run a scheduled save now, before the current inputs go away."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_state()
+    
+    def _do_save_state(self):
+        """Save the state of all current inputs."""
         if hasattr(self, 'method_combo') and hasattr(self, 'input_widgets'):
             current_method_key = self.method_combo.currentData()
             current_inputs = self.get_input_values(validate_expressions=False)  # Don't validate when just saving state
@@ -1517,46 +1811,57 @@ class MainWindow(QMainWindow):
         """Create output widgets for the selected method using translation keys."""
         self.output_widgets = {}
         
-        # Create a GroupBox with the method name and the translated word for "Outputs"
-        outputs_group = QGroupBox(f"{method.name} - {translations.tr('outputs')}")
+        # The GroupBox title and the texts of the rows are set by retranslate_output_widgets
+        outputs_group = QGroupBox()
         outputs_form = QFormLayout(outputs_group)
+        not_computed_text = translations.tr("not_computed_yet")
         
         outputs_info = method.get_outputs()
         for output_info in outputs_info:
             # Use dictionary format only
             output_key = output_info['key']
-            help_key = output_info.get('help_key')
             
-            # Use the key to get the translated label
-            label_text = translations.tr(output_key)
-            
-            # Wrap long labels with adaptive length
-            max_len = self._get_adaptive_max_length()
-            wrapped_text = self._wrap_label_text(label_text, max_len)
-            label_widget = QLabel(f"<b>{wrapped_text}:</b>")
+            label_widget = QLabel()
             label_widget.setWordWrap(True)  # Enable word wrapping
             
-            # Add tooltip if help_key is provided
-            help_text = None
-            if help_key:
-                help_text = translations.tr(help_key)
-                label_widget.setToolTip(help_text)
-            
             # Create the text widget for the output value
-            text_widget = QTextEdit()
+            text_widget = QPlainTextEdit()
             text_widget.setMaximumHeight(60)
             text_widget.setReadOnly(True)
-            text_widget.setPlainText(translations.tr("not_computed_yet"))
-            
-            # Add tooltip to the text widget as well
-            if help_text:
-                text_widget.setToolTip(help_text)
+            text_widget.setPlainText(not_computed_text)
             
             # Use the key to store the widget
             self.output_widgets[output_key] = text_widget
             outputs_form.addRow(label_widget, text_widget)
             
+        self.outputs_group = outputs_group
+        self.retranslate_output_widgets(method)
         self.outputs_layout.addWidget(outputs_group)
+    
+    def retranslate_output_widgets(self, method):
+        """Set the title, labels and tooltips of the current output group in place."""
+        # Create a GroupBox title with the method name and the translated word for "Outputs"
+        self.outputs_group.setTitle(f"{method.name} - {translations.tr('outputs')}")
+        outputs_form = self.outputs_group.layout()
+        
+        # Same for every row
+        max_len = self._get_adaptive_max_length()
+        
+        for output_info in method.get_outputs():
+            output_key = output_info['key']
+            help_key = output_info.get('help_key')
+            text_widget = self.output_widgets[output_key]
+            label_widget = outputs_form.labelForField(text_widget)
+            
+            # Use the key to get the translated label, wrapped with adaptive length
+            wrapped_text = self._wrap_label_text(translations.tr(output_key), max_len)
+            label_widget.setText(f"<b>{wrapped_text}:</b>")
+            
+            # Add tooltip to the label and the text widget if help_key is provided
+            if help_key:
+                help_text = translations.tr(help_key)
+                label_widget.setToolTip(help_text)
+                text_widget.setToolTip(help_text)
         
     def get_input_values(self, validate_expressions: bool = True) -> Dict[str, Any]:
         """Get values from input widgets.
@@ -1578,7 +1883,7 @@ class MainWindow(QMainWindow):
                     if validate_expressions:
                         try:
                             if self.angle_unit_input == "radians":
-                                values[name] = [self.parse_pi_expression(x.strip()) for x in text.split(',') if x.strip()]
+                                values[name] = self.parse_pi_list(text)
                             else:
                                 values[name] = [float(x.strip()) for x in text.split(',') if x.strip()]
                         except Exception as e:
@@ -1605,7 +1910,7 @@ class MainWindow(QMainWindow):
                         try:
                             if self.angle_unit_input == "radians":
                                 # Parse comma-separated pi expressions
-                                angles = [self.parse_pi_expression(x.strip()) for x in text.split(',') if x.strip()]
+                                angles = self.parse_pi_list(text)
                                 values[name] = angles
                             else:
                                 # Parse comma-separated float values
@@ -1656,46 +1961,23 @@ class MainWindow(QMainWindow):
         self.compute_button.setText(translations.tr("computing"))
         
 
-        # --- Create worker and thread with non-conflicting names ---
+        # Run on the shared thread pool so repeated computes reuse a warm thread
         self.worker = ComputationWorker(method, input_values)
-        # *** THE CRITICAL FIX for Pylance errors ***
-        # Use a unique name like 'worker_thread' instead of 'thread' to avoid
-        # conflict with the inherited QObject.thread() method.
-        self.worker_thread = QThread()
-        self.worker.moveToThread(self.worker_thread)
-        
-        # --- Connect signals for a clean lifecycle ---
-        # 1. Start the worker's run() method when the thread starts.
-        self.worker_thread.started.connect(self.worker.run)
-        
-        # 2. Connect the worker's signals to the main window slots.
-        self.worker.finished.connect(self.computation_finished)
-        self.worker.error.connect(self.computation_error)
-        
-        # 3. Ensure the thread is quit and objects are deleted on BOTH success and error.
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.error.connect(self.worker_thread.quit)
-
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.error.connect(self.worker.deleteLater)
-
-        # This signal is emitted after the thread's event loop has finished.
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-        
-        # 4. Start the thread.
-        self.worker_thread.start()
+        self.worker.signals.finished.connect(self.computation_finished)
+        self.worker.signals.error.connect(self.computation_error)
+        QThreadPool.globalInstance().start(self.worker)
         
     def computation_finished(self, results: Dict[str, Any]):
         """Handle computation completion."""
         self.current_results = results
         self.update_output_widgets(results)
         
-        plotting_params = self._get_plotting_parameters()
-        self.plotting_widget.update_plots(results, plotting_params)
+        # Kept so later redraws replay these results without re-reading the inputs
+        self._results_plotting_params = self._get_plotting_parameters()
+        self.plotting_widget.update_plots(results, self._results_plotting_params)
         
         # Update coefficients table
-        if hasattr(self, 'coefficients_table'):
-            self.update_coefficients_table(results)
+        self.update_coefficients_table(results)
             
         # Elements plot is updated automatically by plotting_widget.update_plots()
             
@@ -1703,71 +1985,51 @@ class MainWindow(QMainWindow):
         self.compute_button.setEnabled(True)
         self.compute_button.setText(translations.tr("compute"))
         
+    def _missing_parameter_error(self, error_message: str) -> str:
+        """Translate errors like "missing_parameter:d_lambda" using the parameter's label."""
+        param_name = error_message.split(':', 1)[1]
+        translated_param_key = self.find_label_key_for_param(param_name)
+        translated_param_text = translations.tr(translated_param_key)
+        return f"{translations.tr('missing_parameter')}: '{translated_param_text}'"
+    
+    def _multi_beam_angle_error(self, error_message: str) -> str:
+        """Translate dynamic errors like "multi_beam_angle_error:4:2"."""
+        key, expected, num_beams = error_message.split(':')
+        base_message = translations.tr(key) # e.g., "{1} beams require {0} angles."
+        return base_message.format(expected, num_beams)
+    
+    # Error keys whose message needs more than a lookup
+    _ERROR_HANDLERS = {
+        "missing_parameter": _missing_parameter_error,
+        "multi_beam_angle_error": _multi_beam_angle_error,
+    }
+    
     def computation_error(self, error_message: str):
         """
-        Handles computation errors by translating the error key using a match/case structure.
-        This approach is clean, readable, and scalable.
+        Handles computation errors by translating the error key.
+        Keys are dispatched through lookup tables, so a new error only needs a table entry.
         """
-        translated_error = ""
-        
         # Split the error message to separate the key from potential data
         parts = error_message.split(':', 1)
         key = parts[0]
-
-        match key:
-            case "missing_parameter":
-                # This case handles errors like "missing_parameter:d_lambda"
-                param_name = parts[1]
-                translated_param_key = self.find_label_key_for_param(param_name)
-                translated_param_text = translations.tr(translated_param_key)
-                translated_error = f"{translations.tr('missing_parameter')}: '{translated_param_text}'"
-
-            case "multi_beam_angle_error":
-                # This case handles dynamic errors like "multi_beam_angle_error:4:2"
-                # where the values need to be formatted into the final message.
-                _, expected, num_beams = error_message.split(':')
-                base_message = translations.tr(key) # e.g., "{1} beams require {0} angles."
-                translated_error = base_message.format(expected, num_beams)
-            
-            case "error_could_not_parse_beam_angles":
-                # Handle "error_could_not_parse_beam_angles:1" format
-                if ':' in error_message:
-                    _, beam_number = error_message.split(':', 1)
-                    base_message = translations.tr("error_could_not_parse_beam_angles")
-                    translated_error = f"{base_message} {beam_number}"
-                else:
-                    translated_error = translations.tr("error_could_not_parse_beam_angles")
-            
-            case "error_unknown_beam_shape":
-                # Handle "error_unknown_beam_shape:triangular" format
-                if ':' in error_message:
-                    _, beam_shape = error_message.split(':', 1)
-                    base_message = translations.tr("error_unknown_beam_shape")
-                    translated_error = f"{base_message}: '{beam_shape}'"
-                else:
-                    translated_error = translations.tr("error_unknown_beam_shape")
-            
-            case "error_unknown_normalization_method":
-                # Handle "error_unknown_normalization_method:method_name" format
-                if ':' in error_message:
-                    _, method_name = error_message.split(':', 1)
-                    base_message = translations.tr("error_unknown_normalization_method")
-                    translated_error = f"{base_message}: '{method_name}'"
-                else:
-                    translated_error = translations.tr("error_unknown_normalization_method")
-
-            case "number_of_elements_minimum" | "beam_angles_not_sorted" | "beam_angles_max_repetition" | "could_not_parse_beam_angles" | "invalid_number_of_beams" | "error_could_not_parse_null_angles" | "error_null_positions_cannot_be_empty" | "error_d_lambda_must_be_positive" | "error_resolution_must_be_at_least_16" | "error_main_beam_angle_out_of_range" | "error_number_of_elements_min_2" | "error_number_of_elements_min_1" | "error_sidelobe_level_must_be_finite" | "error_theta0_rad_out_of_range":
-                # This case groups all simple, direct translation keys.
-                # The pipe `|` acts as an "OR", making it very compact.
+        
+        handler = self._ERROR_HANDLERS.get(key)
+        if handler is not None:
+            translated_error = handler(self, error_message)
+        elif key in _DETAIL_ERROR_FORMATS:
+            # Errors like "error_unknown_beam_shape:triangular" show their detail
+            if len(parts) > 1:
+                translated_error = _DETAIL_ERROR_FORMATS[key].format(translations.tr(key), parts[1])
+            else:
                 translated_error = translations.tr(key)
-            
-            case _: # Default case for any unrecognized error
-                # This is the fallback for any error message that doesn't match above.
-                # It tries a direct translation first.
-                translated_error = translations.tr(error_message)
-                if translated_error == error_message: # If translation failed
-                    # Wrap it in a generic error message
-                    translated_error = f"{translations.tr('error_during_computation')} {error_message}"
+        elif key in _SIMPLE_ERROR_KEYS:
+            translated_error = translations.tr(key)
+        else:
+            # Fallback for any unrecognized error: try a direct translation first
+            translated_error = translations.tr(error_message)
+            if translated_error == error_message: # If translation failed
+                # Wrap it in a generic error message
+                translated_error = f"{translations.tr('error_during_computation')} {error_message}"
 
         QMessageBox.critical(self, translations.tr("computation_error"), translated_error)
         
@@ -1779,14 +2041,19 @@ class MainWindow(QMainWindow):
         """Helper to find the label key for a given parameter name."""
         current_method_key = self.method_combo.currentData()
         if current_method_key in self.methods:
-            method = self.methods[current_method_key]
-            for input_def in method.get_inputs(self.angle_unit_input):
-                if input_def['name'] == param_name:
-                    return input_def['label_key']
+            cache_key = (current_method_key, self.angle_unit_input)
+            label_keys = self._label_key_cache.get(cache_key)
+            if label_keys is None:
+                method = self.methods[current_method_key]
+                label_keys = {input_def['name']: input_def['label_key']
+                              for input_def in method.get_inputs(self.angle_unit_input)}
+                self._label_key_cache[cache_key] = label_keys
+            return label_keys.get(param_name, param_name)
         return param_name # Fallback to the parameter name itself
 
     def update_output_widgets(self, results: Dict[str, Any]):
         """Update output widgets with new results using their keys."""
+        not_available_text = translations.tr("not_available")
         # <<< CHANGE: Iterate over the keys in the output widgets dictionary
         for output_key, widget in self.output_widgets.items():
             if output_key in results:
@@ -1795,27 +2062,33 @@ class MainWindow(QMainWindow):
                 widget.setPlainText(text)
             else:
                 # If a key is expected but not in the results, show 'Not available'
-                widget.setPlainText(translations.tr("not_available"))
+                widget.setPlainText(not_available_text)
                 
     def format_output_value(self, value) -> str:
-        """Format output value for display."""
+        """Format output value for display; long arrays and lists are elided in the middle."""
+        if isinstance(value, (np.ndarray, list)) and len(value) > _OUTPUT_PREVIEW_HEAD + _OUTPUT_PREVIEW_TAIL:
+            # Full data stays in current_results for export
+            return (self.format_output_value(value[:_OUTPUT_PREVIEW_HEAD]) + "\n…\n"
+                    + self.format_output_value(value[-_OUTPUT_PREVIEW_TAIL:]))
+        
         if isinstance(value, (int, float)):
             if isinstance(value, float):
-                return f"{value:.{self.precision_decimals}f}"
+                return _fixed_formatter(self.precision_decimals)(value)
             else:
                 return str(value)
         elif isinstance(value, np.ndarray):
+            fixed = f"%.{self.precision_decimals}f"
             if value.dtype == complex:
-                formatted = [f"{x.real:.{self.precision_decimals}f}+{x.imag:.{self.precision_decimals}f}j" 
-                           for x in value]
-                return "\n".join(formatted)  # Show all elements
+                formatted = np.char.add(np.char.add(np.char.mod(fixed, value.real), "+"),
+                                        np.char.mod(fixed + "j", value.imag))
+                return "\n".join(formatted.tolist())
             else:
-                formatted = [f"{x:.{self.precision_decimals}f}" for x in value]
-                return "\n".join(formatted)  # Show all elements
+                formatted = np.char.mod(fixed, value)
+                return "\n".join(formatted.tolist())
         elif isinstance(value, list):
-            formatted = [f"{x:.{self.precision_decimals}f}" if isinstance(x, float) else str(x) 
-                        for x in value]
-            return "\n".join(formatted)  # Show all elements
+            format_float = _fixed_formatter(self.precision_decimals)
+            formatted = [format_float(x) if isinstance(x, float) else str(x) for x in value]
+            return "\n".join(formatted)
         else:
             return str(value)
     
@@ -1844,29 +2117,28 @@ class MainWindow(QMainWindow):
             'outputs': {}
         }
         
-        # Convert results to JSON-serializable format
+        # Arrays, NumPy scalars and complex values are converted by the encoder while
+        # writing, one at a time; other values are exported as text
         for key, value in self.current_results.items():
-            if isinstance(value, np.ndarray):
-                if value.dtype == complex:
-                    # Convert complex arrays to list of [real, imag] pairs
-                    export_data['outputs'][key] = [[float(x.real), float(x.imag)] for x in value]
-                else:
-                    export_data['outputs'][key] = value.tolist()
-            elif isinstance(value, (np.integer, np.floating)):
-                export_data['outputs'][key] = float(value)
-            elif isinstance(value, complex):
-                export_data['outputs'][key] = [float(value.real), float(value.imag)]
-            elif isinstance(value, list):
+            if isinstance(value, (np.ndarray, np.integer, np.floating, complex, list)):
                 export_data['outputs'][key] = value
             else:
                 export_data['outputs'][key] = str(value)
         
         # Write JSON file
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            json.dump(export_data, f, indent=2, ensure_ascii=False, cls=_ResultsJSONEncoder)
     
     def export_array_factor_csv(self, filename: str):
         """Export array factor data to CSV file."""
+        _write_array_factor_csv(filename, self._array_factor_columns(), self.precision_decimals)
+    
+    def _array_factor_columns(self) -> List[np.ndarray]:
+        """Check the current results and return the arrays of the CSV columns.
+        
+        Results are replaced, never modified in place, so the arrays stay valid for a
+        background export while a new computation runs.
+        """
         if not self.current_results:
             raise ValueError("No results available to export")
         
@@ -1875,36 +2147,12 @@ class MainWindow(QMainWindow):
         if missing_keys:
             raise ValueError(f"Array factor data not available in results: {missing_keys}")
         
-        theta_deg = self.current_results['theta_degrees']
-        theta_rad = self.current_results['theta_radians']
-        af = self.current_results['af']
-        normalized_af = self.current_results['normalized_af']
-        af_db = self.current_results['af_db']
-        
-        # Write CSV file
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            writer.writerow(['Theta (degrees)', 'Theta (radians)', 'AF (complex)', 'AF Normalized (complex)', 'AF (dB)'])
-            
-            # Write data
-            for i in range(len(theta_deg)):
-                # Format complex numbers as "real+imag*j"
-                af_complex_str = f"{af[i].real:.{self.precision_decimals}f}{af[i].imag:+.{self.precision_decimals}f}j"
-                af_norm_complex_str = f"{normalized_af[i].real:.{self.precision_decimals}f}{normalized_af[i].imag:+.{self.precision_decimals}f}j"
-                
-                writer.writerow([
-                    f"{theta_deg[i]:.{self.precision_decimals}f}",
-                    f"{theta_rad[i]:.{self.precision_decimals}f}",
-                    af_complex_str,
-                    af_norm_complex_str,
-                    f"{af_db[i]:.{self.precision_decimals}f}"
-                ])
+        return [np.asarray(self.current_results[key]) for key in required_keys]
     
     def export_plots(self, base_filename: str, file_format: str):
         """Export plots using the plotting widget."""
         if hasattr(self, 'plotting_widget'):
+            self._ensure_all_tabs_built()
             return self.plotting_widget.export_plots(base_filename, file_format)
         else:
             raise ValueError("Plotting widget not available")
@@ -1979,43 +2227,65 @@ class MainWindow(QMainWindow):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"array_factor_{method_key}_{timestamp}.csv"
         
-        # Show save dialog
-        filename, _ = QFileDialog.getSaveFileName(
-            self, 
-            "Export Array Factor as CSV", 
-            default_filename,
-            "CSV files (*.csv)"
-        )
-        
-        if filename:
-            try:
-                self.export_array_factor_csv(filename)
-                QMessageBox.information(self, "Export Successful", f"Array factor data exported successfully to:\n{filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Error exporting array factor:\n{str(e)}")
+        # Show save dialog window-modally; the export starts when a file is chosen
+        dialog = QFileDialog(self, "Export Array Factor as CSV", default_filename, "CSV files (*.csv)")
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._export_csv_to)
+        dialog.open()
+    
+    def _export_csv_to(self, filename: str):
+        """Export the array factor CSV to the file chosen in the save dialog."""
+        if not filename:
+            return
+        try:
+            columns = self._array_factor_columns()
+        except Exception as e:
+            self._csv_export_failed(str(e))
+            return
+        # Write the file in the pool so large exports don't freeze the window
+        self.csv_export_worker = CsvExportWorker(filename, columns, self.precision_decimals)
+        self.csv_export_worker.signals.finished.connect(self._csv_export_finished)
+        self.csv_export_worker.signals.error.connect(self._csv_export_failed)
+        QThreadPool.globalInstance().start(self.csv_export_worker)
+    
+    def _csv_export_finished(self, filename: str):
+        QMessageBox.information(self, "Export Successful", f"Array factor data exported successfully to:\n{filename}")
+    
+    def _csv_export_failed(self, error_message: str):
+        QMessageBox.critical(self, "Export Error", f"Error exporting array factor:\n{error_message}")
 
     def _get_plotting_parameters(self) -> Dict[str, Any]:
         """
         Gathers all global parameters relevant for plotting into a single dictionary.
+        The global part is cached until update_global_parameters changes it.
         """
-        # Get current method and input values for elements plot
-        current_method_key = self.method_combo.currentData() if hasattr(self, 'method_combo') else 'Schelkunoff'
-        input_values = self.get_input_values() if hasattr(self, 'input_widgets') else {}
-        layout_type = 'symmetric'
+        if self._plotting_params_cache is None:
+            self._plotting_params_cache = {
+                'threshold_db': self.threshold_db,
+                'angle_unit_rectangular': self.angle_unit_rectangular,
+                'angle_unit_polar': self.angle_unit_polar,
+                'element_phase_unit': self.element_phase_unit,
+                'rectangular_scale': self.rectangular_scale,
+                'polar_scale': self.polar_scale,
+                'normalize_array_factor': self.normalize_array_factor,
+                'angle_unit_input': self.angle_unit_input
+            }
         
-        if current_method_key in self.methods:
-            layout_type = self.methods[current_method_key].layout_type
+        # Get current method and input values for elements plot, cached until an input changes
+        if self._plotting_inputs_cache is None:
+            current_method_key = self.method_combo.currentData() if hasattr(self, 'method_combo') else 'Schelkunoff'
+            input_values = self.get_input_values() if hasattr(self, 'input_widgets') else {}
+            layout_type = 'symmetric'
+            
+            if current_method_key in self.methods:
+                layout_type = self.methods[current_method_key].layout_type
+            self._plotting_inputs_cache = (input_values, layout_type)
+        input_values, layout_type = self._plotting_inputs_cache
         
         return {
-            'threshold_db': self.threshold_db,
-            'angle_unit_rectangular': self.angle_unit_rectangular,
-            'angle_unit_polar': self.angle_unit_polar,
-            'element_phase_unit': self.element_phase_unit,
-            'rectangular_scale': self.rectangular_scale,
-            'polar_scale': self.polar_scale,
-            'normalize_array_factor': self.normalize_array_factor,
+            **self._plotting_params_cache,
             # Parameters for elements plot
             'input_values': input_values,
-            'layout_type': layout_type,
-            'angle_unit_input': self.angle_unit_input
+            'layout_type': layout_type
         }
\ No newline at end of file
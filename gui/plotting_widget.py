@@ -4,7 +4,7 @@ Plotting widget for antenna synthesis visualization.
 
 import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSplitter
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
@@ -20,6 +20,14 @@ import sys
 
 from translations import translations
 
+# Canvas used by the plots. Agg by default; ANTENNA_PLOT_CANVAS=cairo selects the QtCairo
+# canvas, which may rasterize anti-aliased lines faster, when pycairo or cairocffi is installed
+if os.environ.get('ANTENNA_PLOT_CANVAS', '').lower() == 'cairo':
+    try:
+        from matplotlib.backends.backend_qtcairo import FigureCanvasQTCairo as FigureCanvas
+    except ImportError:
+        pass
+
 def resource_path(relative_path):
     """ Obtiene la ruta absoluta al recurso, funciona para desarrollo y para PyInstaller """
     if hasattr(sys, '_MEIPASS'):
@@ -61,6 +69,54 @@ def format_theta_as_pi(value, tick_number):
     else:
         return f"{pi_str}/{den}"
 
+class ResizeDebouncedCanvas(FigureCanvas):
+    """
+    Figure canvas that redraws once a resize settles instead of on every step.
+    
+    Dragging a splitter or the window edge resizes the canvas many times in a row;
+    the figure size follows each step but the redraw waits until no resize
+    has arrived for RESIZE_REDRAW_DELAY_MS. A hidden canvas, e.g. in another
+    tab, draws when it is shown instead of when it is updated.
+    """
+    
+    RESIZE_REDRAW_DELAY_MS = 50
+    
+    _deferring_draw = False
+    # Set while hidden with changes not drawn yet
+    _draw_on_show = False
+    
+    def __init__(self, figure=None):
+        super().__init__(figure)
+        self._resize_redraw_timer = QTimer(self)
+        self._resize_redraw_timer.setSingleShot(True)
+        self._resize_redraw_timer.setInterval(self.RESIZE_REDRAW_DELAY_MS)
+        self._resize_redraw_timer.timeout.connect(self.draw_idle)
+    
+    def resizeEvent(self, event):
+        self._deferring_draw = True
+        try:
+            super().resizeEvent(event)
+        finally:
+            self._deferring_draw = False
+        if hasattr(self, '_resize_redraw_timer'):
+            self._resize_redraw_timer.start()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._draw_on_show:
+            self._draw_on_show = False
+            # Pending before the first paint, which then draws instead of showing the old image
+            super().draw_idle()
+    
+    def draw_idle(self):
+        if self._deferring_draw:
+            return
+        if not self.isVisible():
+            self._draw_on_show = True
+            return
+        super().draw_idle()
+
+
 class PlottingWidget(QWidget):
     """
     Widget for plotting array factors and excitations.
@@ -71,11 +127,20 @@ class PlottingWidget(QWidget):
     - Drag a persistent datatip to move it.
     """
     
-    def __init__(self):
+    def __init__(self, defer_figures: bool = False):
+        """
+        Parameters:
+        -----------
+        defer_figures : bool
+            Skip creating the figures and canvases. The owner assigns its own
+            figures later; plots whose figure is still None are skipped.
+        """
         super().__init__()
         
         # Store current data for interaction
         self.current_results = None 
+        # Thresholded result arrays shared by the plots, keyed by (id(array), floor)
+        self._floored_cache: Dict[tuple, tuple] = {}
 
 
         # self.hover_cursor: mplcursors.Cursor | None = None
@@ -86,7 +151,26 @@ class PlottingWidget(QWidget):
         # Store the latest global params to use in callbacks
         self._global_params: Dict[str, Any] = {}
         
-        self.setup_ui()
+        # Radian tick locator and formatter, attached again to each new rectangular axes
+        self._theta_pi_formatter = FuncFormatter(format_theta_as_pi)
+        self._theta_pi_locator = MultipleLocator(base=np.pi / 8)
+        
+        # Rectangular AF axes kept between updates, its (computed, desired) lines and the
+        # key of everything drawn besides their data
+        self._af_axes = None
+        self._af_lines: tuple = (None, None)
+        self._af_layout_key = None
+        # Results dict and parameters the rectangular AF axes currently show
+        self._af_results = None
+        self._af_plot_spec = None
+        
+        if defer_figures:
+            self.af_figure = self.af_canvas = None
+            self.polar_figure = self.polar_canvas = None
+            self.excitations_figure = self.excitations_canvas = None
+            self.elements_figure = self.elements_canvas = None
+        else:
+            self.setup_ui()
         
     def setup_ui(self):
         """Setup the plotting interface."""
@@ -97,7 +181,7 @@ class PlottingWidget(QWidget):
         layout.addWidget(splitter)
         
         # Top plot: Array Factor (rectangular)
-        self.af_figure = Figure(figsize=(10, 4))
+        self.af_figure = Figure(figsize=(10, 4), layout='none')
         self.af_canvas = FigureCanvas(self.af_figure)
         splitter.addWidget(self.af_canvas)
         
@@ -106,19 +190,19 @@ class PlottingWidget(QWidget):
         bottom_layout = QHBoxLayout(bottom_widget)
         
         # Polar plot
-        self.polar_figure = Figure(figsize=(5, 4))
+        self.polar_figure = Figure(figsize=(5, 4), layout='none')
         self.polar_canvas = FigureCanvas(self.polar_figure)
         bottom_layout.addWidget(self.polar_canvas)
         
         # Excitations plot
-        self.excitations_figure = Figure(figsize=(5, 4))
+        self.excitations_figure = Figure(figsize=(5, 4), layout='none')
         self.excitations_canvas = FigureCanvas(self.excitations_figure)
         bottom_layout.addWidget(self.excitations_canvas)
         
         splitter.addWidget(bottom_widget)
         
         # Array elements plot (separate widget)
-        self.elements_figure = Figure(figsize=(12, 6))
+        self.elements_figure = Figure(figsize=(12, 6), layout='none')
         self.elements_canvas = FigureCanvas(self.elements_figure)
         splitter.addWidget(self.elements_canvas)
         
@@ -193,32 +277,33 @@ class PlottingWidget(QWidget):
             self.clear_plots()
             return
         
+        if results is not self.current_results:
+            self._floored_cache.clear()
         self.current_results = results
             
         try:
-            artists1 = self.plot_array_factor_rectangular(results, global_params)
-            artists2 = self.plot_array_factor_polar(results, global_params)
-            artists3 = self.plot_excitations(results)
-            self.plot_array_elements(results, global_params)
+            artists1 = self.plot_array_factor_rectangular(results, global_params) if self.af_figure is not None else None
+            artists2 = self.plot_array_factor_polar(results, global_params) if self.polar_figure is not None else None
+            artists3 = self.plot_excitations(results) if self.excitations_figure is not None else None
+            if self.elements_figure is not None:
+                self.plot_array_elements(results, global_params)
 
             # FIX 3 & 4: Ensure we are summing lists, not None types
             all_artists = (artists1 or []) + (artists2 or []) + (artists3 or [])
             self.setup_interactions(all_artists)
                 
-            self.af_canvas.draw()
-            self.polar_canvas.draw()
-            self.excitations_canvas.draw()
-            self.elements_canvas.draw()
+            self.redraw_plots()
             
         except Exception as e:
             print(f"Error updating plots: {e}")
             self.clear_plots()
             
     def plot_array_factor_rectangular(self, results: Dict[str, Any], params: Dict[str, Any]):
-        """Plot array factor in rectangular coordinates. This function only visualizes data."""
-
-        self.af_figure.clear()
-        ax = self.af_figure.add_subplot(111)
+        """Plot array factor in rectangular coordinates. This function only visualizes data.
+        
+        When only the data changed since the last plot, the existing lines and axis
+        limits are updated in place instead of rebuilding the axes.
+        """
         interactive_artists: List[Any] = []
         
         # Determine which data arrays to use based on the scale
@@ -226,6 +311,13 @@ class PlottingWidget(QWidget):
         threshold_db = params.get('threshold_db', -90)
         angle_unit = params.get('angle_unit_rectangular', 'degrees')
         normalize = params.get('normalize_array_factor', True)
+        
+        # Same results dict and parameters as the last plot: the axes already show them.
+        # Results are never modified once computed, so identity is enough.
+        plot_spec = (scale, threshold_db, angle_unit, normalize, translations.get_language())
+        if (results is self._af_results and plot_spec == self._af_plot_spec
+                and self._af_axes in self.af_figure.axes):
+            return [line for line in self._af_lines if line is not None]
 
         if scale == 'linear':
             # Choose between normalized or original AF based on user preference
@@ -239,7 +331,7 @@ class PlottingWidget(QWidget):
             
             af_data = np.abs(af_complex) if af_complex is not None else None
             af_desired_data = np.abs(af_desired_complex) if af_desired_complex is not None else None
-            y_label = translations.tr("array_factor_linear")
+            y_label_key = "array_factor_linear"
             max_af = np.max(af_data) if af_data is not None else 1.0
             y_max, y_min = max_af*1.1, 0
             threshold_val = 10**(threshold_db / 20)
@@ -247,38 +339,75 @@ class PlottingWidget(QWidget):
             # Default to dB
             af_data = results.get('af_db')
             af_desired_data = results.get('desired_af_db')
-            y_label = translations.tr("array_factor_db")
-            y_label, y_max, y_min = translations.tr("array_factor_db"), 5, threshold_db - 5
+            y_label_key, y_max, y_min = "array_factor_db", 5, threshold_db - 5
             threshold_val = threshold_db
             max_af = None  # Not applicable in dB scale
 
         # If primary data is missing, do nothing and return
         if af_data is None: 
+            ax = self._new_af_axes()
             ax.text(0.5, 0.5, translations.tr("no_data_to_display"), ha='center', va='center')
             return        
 
         # Determine which angle array to use
         if angle_unit == 'radians':
             theta = results.get('theta_radians', [])
-            x_label = translations.tr("angle_theta_radians")            
+            x_label_key = "angle_theta_radians"
+        else:
+            theta = results.get('theta_degrees', [])
+            x_label_key = "angle_theta_degrees"
 
+        if len(theta) == 0:
+            self._new_af_axes()
+            return
+        
+        # Values drawn, floored at the threshold. The linear magnitudes are fresh arrays owned
+        # here, floored in place; dB data come from the shared per-result cache. Either way
+        # no array handed to a line is written to later, as Line2D may keep a reference.
+        if scale == 'linear':
+            af_plot = np.maximum(af_data, threshold_val, out=af_data)
+            af_desired_plot = np.maximum(af_desired_data, threshold_val, out=af_desired_data) if af_desired_data is not None else None
+        else:
+            af_plot = self._floored(af_data, threshold_val)
+            af_desired_plot = self._floored(af_desired_data, threshold_val) if af_desired_data is not None else None
+        
+        # Everything drawn besides the lines' data: the legend shows the threshold, the
+        # desired SLL and the non-normalized maximum
+        layout_key = (scale, angle_unit, normalize, threshold_db, len(theta),
+                      af_desired_data is not None, results.get('sidelobe_level_desired'),
+                      max_af if scale == 'linear' and not normalize else None,
+                      translations.get_language())
+        
+        # Same layout as the last plot: only move the lines and the limits
+        if layout_key == self._af_layout_key and self._af_axes in self.af_figure.axes:
+            computed_line, desired_line = self._af_lines
+            computed_line.set_data(theta, af_plot)
+            interactive_artists.append(computed_line)
+            if desired_line is not None:
+                desired_line.set_data(theta, af_desired_plot)
+                interactive_artists.append(desired_line)
+            self._af_axes.set_xlim(theta[0], theta[-1])
+            self._af_axes.set_ylim(y_min, y_max)
+            self._af_results, self._af_plot_spec = results, plot_spec
+            return interactive_artists
+        
+        ax = self._new_af_axes()
+        if angle_unit == 'radians':
             # 2. Aplica el formateador al eje X
-            ax.xaxis.set_major_formatter(FuncFormatter(format_theta_as_pi))
+            ax.xaxis.set_major_formatter(self._theta_pi_formatter)
 
             # 3. (Optional) Manually define where you want the ticks for better control
-            ax.xaxis.set_major_locator(MultipleLocator(base=np.pi / 8))
-        else:
-            theta = results.get('theta_degrees', [])
-            x_label = translations.tr("angle_theta_degrees")
-
-        if len(theta) == 0: return
+            ax.xaxis.set_major_locator(self._theta_pi_locator)
 
         # Plot reconstructed array factor (always present) using np.maximun to show the umbral
-        interactive_artists.extend(ax.plot(theta, np.maximum(af_data, threshold_val), 'b-', linewidth=2, label=translations.tr("array_factor_computed")))
+        computed_line, = ax.plot(theta, af_plot, 'b-', linewidth=2, label=translations.tr("array_factor_computed"))
+        interactive_artists.append(computed_line)
 
         # Plot desired array factor (if available)
+        desired_line = None
         if af_desired_data is not None:
-            interactive_artists.extend(ax.plot(theta, np.maximum(af_desired_data, threshold_val), 'r--', linewidth=1.5, label=translations.tr("desired_pattern")))
+            desired_line, = ax.plot(theta, af_desired_plot, 'r--', linewidth=1.5, label=translations.tr("desired_pattern"))
+            interactive_artists.append(desired_line)
 
         # Plot desired sidelobe level line (if available)
         if 'sidelobe_level_desired' in results:
@@ -305,16 +434,27 @@ class PlottingWidget(QWidget):
             ax.axhline(y=threshold_val, color='gray', linestyle=':', alpha=0.7, label=f"{translations.tr('threshold')} ({threshold_db} dB)")
 
         ax.set_title(translations.tr("array_factor_vs_angle"))
-        ax.set_xlabel(x_label)
-        ax.set_ylabel(y_label)
+        # Labels are translated only here, when the axes are rebuilt; the language is part of layout_key
+        ax.set_xlabel(translations.tr(x_label_key))
+        ax.set_ylabel(translations.tr(y_label_key))
         ax.grid(True, linestyle=':', alpha=0.6)
         ax.legend()
         ax.set_xlim(theta[0], theta[-1])
         ax.set_ylim(y_min, y_max)
         
         self.af_figure.tight_layout()
-
+        
+        self._af_lines, self._af_layout_key = (computed_line, desired_line), layout_key
+        self._af_results, self._af_plot_spec = results, plot_spec
         return interactive_artists
+    
+    def _new_af_axes(self):
+        """Clear the rectangular AF figure and add fresh axes, forgetting the kept lines."""
+        self.af_figure.clear()
+        self._af_axes = self.af_figure.add_subplot(111)
+        self._af_lines, self._af_layout_key = (None, None), None
+        self._af_results = self._af_plot_spec = None
+        return self._af_axes
 
     def plot_array_factor_polar(self, results: Dict[str, Any], params: Dict[str, Any]):
         """Plot array factor in polar coordinates."""
@@ -353,7 +493,7 @@ class PlottingWidget(QWidget):
         if af_data is None or len(af_data) == 0: return
 
         # Apply the threshold for visualization purposes
-        af_thresholded = np.maximum(af_data, r_min)
+        af_thresholded = self._floored(af_data, r_min)
         
         # Original data for the right side (0 to 180 degrees)
         theta_rad_right = results.get('theta_radians', [])
@@ -376,7 +516,7 @@ class PlottingWidget(QWidget):
         
         # Plot the full desired array factor (if available)
         if af_desired_data is not None:
-            af_desired_thresholded = np.maximum(af_desired_data, r_min)
+            af_desired_thresholded = self._floored(af_desired_data, r_min)
             af_desired_left = af_desired_thresholded[::-1]
             af_desired_full = np.concatenate([af_desired_thresholded, af_desired_left])
             ax.plot(theta_full, af_desired_full, 'r--', linewidth=1.5, label=translations.tr("desired"))
@@ -491,6 +631,22 @@ class PlottingWidget(QWidget):
 
         return [mag_stem_container.stemlines, phase_stem_container.stemlines]
 
+    def _floored(self, data: np.ndarray, floor: float) -> np.ndarray:
+        """np.maximum(data, floor), computed once per result array and floor.
+        
+        The rectangular and polar dB plots floor the same arrays at the threshold.
+        Only arrays of the current results are cached; holding them keeps their id
+        from being reused while the entry exists.
+        """
+        key = (id(data), floor)
+        hit = self._floored_cache.get(key)
+        if hit is not None and hit[0] is data:
+            return hit[1]
+        floored = np.maximum(data, floor)
+        if self.current_results is not None and any(data is value for value in self.current_results.values()):
+            self._floored_cache[key] = (data, floored)
+        return floored
+    
     def _select_element_canvas(self, layout_type: str, num_elements: int) -> str:
         """
         Select the appropriate element placement image based on layout type and number of elements.
@@ -563,7 +719,7 @@ class PlottingWidget(QWidget):
             title = f"{layout_type.title()} Array Layout ({num_elements} elements)"
             ax.set_title(title, fontsize=12, pad=10)
             
-            self.elements_canvas.draw()
+            self.elements_canvas.draw_idle()
             
         except Exception as e:
             # Show error message if plot generation fails
@@ -573,27 +729,47 @@ class PlottingWidget(QWidget):
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis('off')
-            self.elements_canvas.draw()
+            self.elements_canvas.draw_idle()
         
-    def clear_plots(self):
-        """Clear all plots and display a message."""
+    def clear_plots(self, redraw: bool = True):
+        """Clear all plots and display a message.
+        
+        Parameters:
+        -----------
+        redraw : bool
+            Schedule a redraw of the canvases. Callers that redraw later pass
+            False and finish with redraw_plots().
+        """
 
         # if self.hover_cursor: self.hover_cursor.remove()
         # if self.click_cursor: self.click_cursor.remove()
         self.hover_cursor = None
         self.click_cursor = None
+        self._floored_cache.clear()
+        self._af_axes, self._af_lines, self._af_layout_key = None, (None, None), None
+        self._af_results = self._af_plot_spec = None
 
         for fig in [self.af_figure, self.polar_figure, self.excitations_figure, self.elements_figure]:
+            if fig is None:
+                continue
             fig.clear()
             ax = fig.add_subplot(111)
             ax.text(0.5, 0.5, translations.tr("not_computed"), ha='center', va='center', fontsize=12, alpha=0.5)
             ax.set_xticks([])
             ax.set_yticks([])
         
-        self.af_canvas.draw()
-        self.polar_canvas.draw()
-        self.excitations_canvas.draw()
-        self.elements_canvas.draw()
+        if redraw:
+            self.redraw_plots()
+    
+    def redraw_plots(self):
+        """Schedule a redraw of all canvases."""
+        for canvas in self._canvases():
+            canvas.draw_idle()
+    
+    def _canvases(self) -> List[FigureCanvas]:
+        """Canvases that currently exist, skipping deferred ones."""
+        canvases = [self.af_canvas, self.polar_canvas, self.excitations_canvas, self.elements_canvas]
+        return [canvas for canvas in canvases if canvas is not None]
     
     def export_plots(self, base_filename: str, file_format: str = 'png'):
         """
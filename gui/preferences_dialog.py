@@ -83,7 +83,8 @@ class PreferencesDialog(QDialog):
         self.font_size_spinbox.valueChanged.connect(self.on_font_size_changed)
     
     def load_current_values(self):
-        """Load current values."""
+        """Load current values without emitting change signals."""
+        self.updating = True
         current_language = translations.get_language()
         # Find the index of the current language
         for i in range(self.language_combo.count()):
@@ -93,9 +94,10 @@ class PreferencesDialog(QDialog):
         
         # Load current font size from config
         config_manager = ConfigManager()
-        config = config_manager.load_config()
+        config = config_manager.load_config_readonly()
         current_font_size = config.get('font_size', 12)
         self.font_size_spinbox.setValue(current_font_size)
+        self.updating = False
     
     def on_language_changed(self, index):
         """Handle language change."""
@@ -160,10 +162,3 @@ class PreferencesDialog(QDialog):
     def get_font_size(self) -> int:
         """Get the selected font size."""
         return self.font_size_spinbox.value()
-    
-    def closeEvent(self, event):
-        """Handle close event."""
-        # Disconnect signals to prevent issues when closing
-        if hasattr(self, 'language_combo'):
-            self.language_combo.currentIndexChanged.disconnect()
-        super().closeEvent(event)
\ No newline at end of file
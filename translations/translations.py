@@ -532,11 +532,14 @@ class Translations:
                 "array_factor_polar": "Factor de array (polar)",
             }
         }
+        # Table of the current language, so tr() is a single lookup
+        self._current_table = self.translations[self.current_language]
     
     def set_language(self, language_code: str):
         """Set the current language."""
         if language_code in self.translations:
             self.current_language = language_code
+            self._current_table = self.translations[language_code]
     
     def get_language(self) -> str:
         """Get the current language code."""
@@ -544,7 +547,7 @@ class Translations:
     
     def tr(self, key: str) -> str:
         """Translate a key to the current language."""
-        return self.translations[self.current_language].get(key, key)
+        return self._current_table.get(key, key)
     
     def get_available_languages(self) -> dict:
         """Get available languages."""